@@ -0,0 +1,49 @@
+if __name__ == '__main__':
+    # Usage Example
+    # python3 json2bin.py data/circular_path.json
+    # Converts the waypoints file to data/circular_path.f64bin, which can be used as path_file of the target
+
+    import argparse
+
+    # Parse command-line arguments
+    parser = argparse.ArgumentParser(description='Convert a JSON waypoints file to the raw .f64bin format.')
+    parser.add_argument('path_file', help='JSON file containing the trajectory waypoints')
+    parser.add_argument('--output', help='Output .f64bin file, by default the JSON file with the .f64bin suffix')
+    args = parser.parse_args()
+
+    # NumPy is imported after the arguments are parsed, so --help does not load it
+    import numpy as np
+    import json
+    import os
+
+    output = args.output or os.path.splitext(args.path_file)[0] + ".f64bin"
+
+    # Reads the data from the JSON file
+    with open(args.path_file, 'r') as f:
+        data = json.load(f)
+
+    # Edge case
+    if not isinstance(data, list):
+        raise ValueError(f"json2bin: Invalid waypoints file, the top level must be a list: {args.path_file}")
+
+    # Extracts the coordinates of each waypoint, {"x": val, "y": val, "z": val}
+    rows = []
+    for entry in data:
+        if not isinstance(entry, dict) or not entry.keys() >= {"x", "y", "z"}:
+            raise ValueError(f"json2bin: Invalid waypoint object. Must contain x, y, z keys: {entry}")
+        rows.append((entry["x"], entry["y"], entry["z"]))
+
+    # The file holds the (N, 3) matrix as raw little-endian float64 values, row by row, without a header
+    waypoints = np.asarray(rows, dtype='<f8').reshape(-1, 3)
+
+    # Edge case
+    # The standard JSON parser accepts the NaN and Infinity literals
+    if not np.isfinite(waypoints).all():
+        raise ValueError(f"json2bin: Invalid waypoints file, the coordinates must be finite numbers: {args.path_file}")
+
+    # Writes a temporary file and then renames it, so a target starting meanwhile never maps a partial file
+    tmp_file = f"{output}.{os.getpid()}.tmp"
+    waypoints.tofile(tmp_file)
+    os.replace(tmp_file, output)
+
+    print(f"json2bin: Written {waypoints.shape[0]} waypoints to {output}")
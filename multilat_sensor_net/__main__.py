@@ -0,0 +1,133 @@
+"""Command-line entry point of the multilat_sensor_net package.
+
+A single command starts any component of the sensor network, the component is selected
+by the role subcommand. Only the package of the selected role is imported, after the
+arguments are parsed, so --help does not load gRPC, ZeroMQ, and NumPy.
+
+Usage Example:
+    python3 -m multilat_sensor_net target
+    python3 -m multilat_sensor_net network
+    python3 -m multilat_sensor_net node --node_id 3 --pos 2.8 4.5 0.65
+    python3 -m multilat_sensor_net client --verbose
+"""
+
+import argparse
+
+
+def _run_target(args: argparse.Namespace) -> None:
+    """Starts the Target with the parsed arguments."""
+    from multilat_sensor_net.target import TargetController
+
+    # Create TargetController object with the parsed arguments
+    obj = TargetController(
+        socket_addr="localhost:50051",
+        uds_addr="unix:/tmp/multilat_target.sock",  # The nodes on the same host connect to the unix domain socket
+        path_file="data/circular_path.json",
+        freq=3,
+        loop_path=True,
+        verbose=args.verbose  # Set verbosity based on the argument
+    )
+
+    # Start the TargetController
+    obj.start()
+
+
+def _run_network(args: argparse.Namespace) -> None:
+    """Starts the Network with the parsed arguments."""
+    from multilat_sensor_net.network import NetworkController
+
+    # Create NetworkController object with the parsed arguments
+    obj = NetworkController(socket_addr="localhost:50052", verbose=args.verbose)
+    obj.start()
+
+
+def _run_node(args: argparse.Namespace) -> None:
+    """Starts the Node with the parsed arguments."""
+    from multilat_sensor_net.node import NodeController
+    import numpy as np
+
+    # Create NodeController object with the parsed arguments
+    obj = NodeController(
+        node_id=args.node_id,
+        pos=np.array(args.pos),
+        bind_address=f"tcp://*:555{args.node_id}",
+        target_service_addr="unix:/tmp/multilat_target.sock",  # The target runs on the same host
+        network_service_addr="localhost:50052",
+        verbose=args.verbose
+    )
+
+    # Start the NodeController
+    obj.start()
+
+
+def _run_client(args: argparse.Namespace) -> None:
+    """Starts the Client Application with the parsed arguments."""
+    from multilat_sensor_net.client import ClientApp
+    from datetime import datetime
+    import asyncio
+
+    # Uses the libuv based event loop when available, otherwise the default asyncio loop is kept
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+    # Format the current date and time
+    current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    # For low-speed objects use 10-20Hz
+    # For high-speed objects use 20-30Hz
+    obj = ClientApp(
+        client_id=1,
+        service_addr="localhost:50052",
+        freq=15,
+        output_trajectory_path=f"data/run_{current_time}.csv",
+        verbose=args.verbose
+    )
+
+    obj.run()
+
+
+def _add_node_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the arguments specific to the node role."""
+    parser.add_argument('--node_id', type=int, required=True, help='Node ID')
+    parser.add_argument('--pos', type=float, nargs=3, required=True, help='Position as [x, y, z]')
+
+
+# Roles of the command line, each one maps to its description, the function adding
+# the role specific arguments, and the function starting the component
+_ROLES = {
+    "target": ('Start the Target.', None, _run_target),
+    "network": ('Start the Network.', None, _run_network),
+    "node": ('Start the Node.', _add_node_arguments, _run_node),
+    "client": ('Start the Client Application.', None, _run_client),
+}
+
+
+def main(argv: list = None) -> None:
+    """Parses the command-line arguments and starts the component of the selected role.
+
+    Args:
+        argv: The list of command-line arguments, without the program name.
+            If None, the arguments of the process are used.
+    """
+    # Parse command-line arguments
+    parser = argparse.ArgumentParser(prog='multilat_sensor_net', description='Start a component of the sensor network.')
+    subparsers = parser.add_subparsers(dest='role', required=True, metavar='role')
+
+    for role, (description, add_arguments, run) in _ROLES.items():
+        sub = subparsers.add_parser(role, help=description, description=description)
+        sub.add_argument('--verbose', action='store_true', help='Enable verbose mode')
+        if add_arguments is not None:
+            add_arguments(sub)
+        sub.set_defaults(run=run)
+
+    args = parser.parse_args(argv)
+
+    # The package of the role is imported by its function, after the arguments are parsed
+    args.run(args)
+
+
+if __name__ == '__main__':
+    main()
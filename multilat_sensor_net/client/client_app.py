@@ -1,7 +1,7 @@
 """This module implements the ClientApp class.
 
 The ClientApp class is responsible for implementing the application. It communicates with the distributed
-network via gRPC to retrieve the target global position, and to track and predict its state.
+network via asynchronous gRPC streaming to retrieve the target global position, and to track and predict its state.
 
 Classes:
     ClientApp: ClientApp class that implements the client application.
@@ -24,10 +24,32 @@ Usage Example:
 """
 
 from multilat_sensor_net.generated import network_pb2, network_pb2_grpc
-from multilat_sensor_net.client import Tracker
+from .tracker import Tracker
 import numpy as np
+import asyncio
 import grpc
-import time
+
+
+# Number of predicted positions buffered before writing them into the csv file
+_LINES_PER_WRITE = 32
+
+# Size [bytes] of the csv file buffer
+_FILE_BUFFER_SIZE = 64 * 1024
+
+# Wire format of the target position in the responses, three little-endian doubles
+_POS_DTYPE = np.dtype('<f8')
+
+# Options of the gRPC channel, tuned for the latency of small messages.
+# The keepalive pings detect a dead connection while the stream is idle,
+# the local subchannel pool avoids sharing the connection with other channels.
+_CHANNEL_OPTIONS = [
+    ('grpc.optimization_target', 'latency'),
+    ('grpc.keepalive_time_ms', 10000),
+    ('grpc.keepalive_timeout_ms', 2000),
+    ('grpc.http2.min_time_between_pings_ms', 10000),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.use_local_subchannel_pool', 1),
+]
 
 
 class ClientApp:
@@ -36,15 +58,25 @@ class ClientApp:
     This class implements the logic for the client application. It communicates via gRPC
     with a distributed network to manage its behavior and requests the target global position.
 
+    The application runs on an asyncio event loop and receives the target positions from a
+    server-streaming call, the distributed network pushes a new position at the requested
+    frequency, so the client never polls nor sleeps.
+
     Attributes:
         client_id: An integer indicating the client ID.
+        service_addr: A string containing the gRPC service address for the distributed network.
+        start_timeout: A float indicating the time [s] to wait for the distributed network to start.
+        compression: A grpc.Compression indicating the compression algorithm of the channel, or None.
         verbose: A boolean flag that enables logging for debugging purposes. If True, detailed
             logs about actions performed by the components will be printed to the console.
         freq: A float indicating the frequency [Hz] of request for the target position.
         output_trajectory_path: A string containing the name and the path of the CSV file
             used to store the target predicted position.
         _tracker: A Tracker instance used to track the target in a 3D space.
-        _channel: A gRPC channel for communicating with the distributed network service.
+        _start_request: A StartRequest message used to start the distributed network.
+        _target_request: A TargetRequest message used to stream the target global position.
+        _channel: A gRPC asyncio channel for communicating with the distributed network service.
+            It is created when the application runs, since it is bound to the running event loop.
         _network_stub: A gRPC stub object used to call remote methods on the network service.
     """
 
@@ -54,7 +86,9 @@ class ClientApp:
             service_addr: str,
             freq: float,
             output_trajectory_path: str,
-            verbose: bool = False
+            verbose: bool = False,
+            start_timeout: float = 5.,
+            compression: grpc.Compression = None
     ) -> None:
         """Initializes the ClientApp.
 
@@ -64,6 +98,9 @@ class ClientApp:
             freq: The frequency [Hz] at which distance measurements are requested.
             output_trajectory_path: The CSV file path where to output the tracked target position.
             verbose: Flag indicating whether the classes must produce an output.
+            start_timeout: The time [s] to wait for the distributed network to start.
+            compression: The compression algorithm of the gRPC channel, e.g. grpc.Compression.Gzip.
+                The messages are small, so by default they are not compressed.
         """
         # Client attributes
         self.client_id = client_id
@@ -77,81 +114,121 @@ class ClientApp:
         self._tracker = Tracker()
 
         # gRPC attributes
-        self._channel = grpc.insecure_channel(service_addr)
-        self._network_stub = network_pb2_grpc.NetworkStub(self._channel)
+        self.service_addr = service_addr
+        self.start_timeout = start_timeout
+        self.compression = compression
+        self._channel = None
+        self._network_stub = None
 
-    def _start_network(self) -> bool:
+        # Request messages, they never change so they are created once
+        self._start_request = network_pb2.StartRequest(client_id=self.client_id)
+        self._target_request = network_pb2.TargetRequest(client_id=self.client_id, freq=self.freq)
+
+    async def _start_network(self) -> bool:
         """Starts the distributed network via gRPC.
 
         Returns:
              True if the network was successfully started; False otherwise.
         """
-        # Creates a request message
-        request = network_pb2.StartRequest(client_id=self.client_id)
-
-        # Ask the distributed network to start operating using the gRPC function
-        response = self._network_stub.StartNetwork(request)
+        try:
+            # Ask the distributed network to start operating using the gRPC function.
+            # The call fails if the distributed network does not answer before the timeout.
+            response = await self._network_stub.StartNetwork(self._start_request, timeout=self.start_timeout)
+        except grpc.RpcError as rpc_error:
+            print(f"ClientApp: Error during gRPC communication with distributed network")
+            return False
 
         return response.status == network_pb2.SS_OK
 
-    def _track_target(self) -> None:
+    async def _track_target(self) -> None:
         """Tracks the target position using the tracker and the distributed network.
 
-        The target global position is requested at the distributed network via gRPC,
-        then this measurement is used in the tracker to predict and update the predicted
-        target position.
-
-        When a keyboard interrupt is identified, the function stops the distributed network.
+        The target global position is streamed by the distributed network via gRPC
+        at the specified frequency, then each measurement is used in the tracker to
+        predict and update the predicted target position.
         """
-        # Create a request message
-        request = network_pb2.TargetRequest(client_id=self.client_id)
-
-        try:
-            with open(self.output_trajectory_path, 'a') as file:
-                # Writes the header of the csv file
-                file.write("X;Y;Z\n")
-
-                # Main loop
-                while True:
-                    # Asks the distributed network to send the target global position using gRPC
-                    # The function call will block execution until it receives a response
-                    # from the server or encounters an error (like a timeout)
-                    response = self._network_stub.GetTargetGlobalPosition(request)
-
+        # Lines of the csv file waiting to be written, they are written in batches to reduce the syscalls
+        lines = []
+
+        with open(self.output_trajectory_path, 'ab', buffering=_FILE_BUFFER_SIZE) as file:
+            # Writes the header of the csv file
+            file.write(b"X;Y;Z\n")
+
+            # Binds the attributes used in the main loop to local names to avoid repeated lookups
+            # The stream has no timeout, since it lasts until the application is stopped
+            stream = self._network_stub.GetTargetGlobalPosition(self._target_request)
+            track = self._tracker.tracker_core
+            get_pos = self._tracker.get_predicted_position
+            append = lines.append
+            write = file.write
+
+            # Printf-style formatting of the csv lines is cheaper than the f-string format specs
+            fmt = "%.3f;%.3f;%.3f\n".__mod__
+            verbose = self.verbose
+
+            try:
+                # Main loop, each response of the distributed network is received from the stream
+                async for response in stream:
                     # Edge case
-                    # Check if the network is not active
+                    # The network is not active, then the stream ends, or too few nodes replied in this round.
+                    # The measurement is skipped, so the tracker is never updated with an invalid position.
                     if response.status == network_pb2.TS_ERROR:
-                        if self.verbose:
-                            print(f"ClientApp: Cannot retrieve target position because the network is not active")
+                        if verbose:
+                            print(f"ClientApp: Cannot retrieve target position in this round")
 
-                        return
+                        continue
 
-                    # Creates the measurement array from the response
-                    measurement = np.array([response.x, response.y, response.z])
+                    # Reads the measurement from the response as a read-only view on the raw bytes, without copies
+                    measurement = np.frombuffer(response.pos, dtype=_POS_DTYPE)
 
                     # Tracks the target
-                    self._tracker.tracker_core(measurement=measurement)
+                    track(measurement=measurement)
 
                     # Gets the predicted target position
-                    pred_pos = self._tracker.get_predicted_position()
+                    pred_pos = get_pos()
 
-                    if self.verbose:
+                    if verbose:
                         print(f"ClientApp: Predicted position: {pred_pos[0]:.3f};{pred_pos[1]:.3f};{pred_pos[2]:.3f}")
 
-                    # Appends the predicted position into the csv file
-                    file.write(f"{pred_pos[0]:.3f};{pred_pos[1]:.3f};{pred_pos[2]:.3f}\n")
+                    # Appends the predicted position into the csv lines buffer
+                    append(fmt((pred_pos[0], pred_pos[1], pred_pos[2])))
 
-                    # Sleeps for an interval to match the specified frequency
-                    time.sleep(1.0 / self.freq)
-        except KeyboardInterrupt:
-            print("ClientApp: Application stopped")
+                    # Writes the buffered lines into the csv file
+                    if len(lines) >= _LINES_PER_WRITE:
+                        write("".join(lines).encode())
+                        lines.clear()
+            finally:
+                # Writes the remaining lines, also when the application is stopped
+                if lines:
+                    write("".join(lines).encode())
+
+    async def _run(self) -> None:
+        """Starts the distributed network and tracks the target on the running event loop.
+        """
+        # The asyncio channel must be created inside the running event loop
+        self._channel = grpc.aio.insecure_channel(
+            self.service_addr,
+            options=_CHANNEL_OPTIONS,
+            compression=self.compression
+        )
+        self._network_stub = network_pb2_grpc.NetworkStub(self._channel)
+
+        try:
+            if await self._start_network():
+                print("ClientApp: Network started")
+
+                await self._track_target()
+            else:
+                print("ClientApp: Failed to start the network")
+        finally:
+            await self._channel.close()
 
     def run(self) -> None:
         """Executes the client application.
-        """
-        if self._start_network():
-            print("ClientApp: Network started")
 
-            self._track_target()
-        else:
-            print("ClientApp: Failed to start the network")
+        When a keyboard interrupt is identified, the event loop is stopped.
+        """
+        try:
+            asyncio.run(self._run())
+        except KeyboardInterrupt:
+            print("ClientApp: Application stopped")
@@ -30,6 +30,141 @@ Usage Example:
 """
 
 import numpy as np
+import math
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional, without it the kernels are executed as plain NumPy code
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, fastmath=True)
+def _cho_solve3(B: np.ndarray, S: np.ndarray, K: np.ndarray) -> None:
+    """Solves K @ S = B for K using the Cholesky decomposition of a 3x3 matrix.
+
+    The symmetric positive definite matrix S = L @ L.T is factorized with an unrolled
+    Cholesky decomposition, then each row of K is obtained with a forward substitution
+    (v @ L.T = b) and a back substitution (k @ L = v) on the related row of B, without
+    computing the explicit inverse of S.
+
+    Args:
+        B: A Nx3 numpy matrix indicating the right-hand side.
+        S: A 3x3 symmetric positive definite numpy matrix.
+        K: A Nx3 numpy matrix where the solution is written.
+    """
+    # Cholesky decomposition (S = L @ L.T)
+    l00 = math.sqrt(S[0, 0])
+    l10 = S[1, 0] / l00
+    l20 = S[2, 0] / l00
+    l11 = math.sqrt(S[1, 1] - l10 * l10)
+    l21 = (S[2, 1] - l20 * l10) / l11
+    l22 = math.sqrt(S[2, 2] - l20 * l20 - l21 * l21)
+
+    for i in range(B.shape[0]):
+        # Forward substitution (v @ L.T = b)
+        v0 = B[i, 0] / l00
+        v1 = (B[i, 1] - v0 * l10) / l11
+        v2 = (B[i, 2] - v0 * l20 - v1 * l21) / l22
+
+        # Back substitution (k @ L = v)
+        k2 = v2 / l22
+        k1 = (v1 - k2 * l21) / l11
+        K[i, 0] = (v0 - k1 * l10 - k2 * l20) / l00
+        K[i, 1] = k1
+        K[i, 2] = k2
+
+
+@njit(cache=True, fastmath=True)
+def _predict_cv(
+        x: np.ndarray,
+        P: np.ndarray,
+        Q: np.ndarray,
+        dt: float,
+        tmp3: np.ndarray,
+        tmp36: np.ndarray,
+        tmp63: np.ndarray
+) -> None:
+    """Estimates in place the future state and covariance of a constant velocity model.
+
+    The update matrix F = [[I, dt * I], [0, I]] is never built: F @ x only moves the position
+    by dt times the velocity, while F @ P @ F.T only adds dt times the velocity rows and
+    columns of P to the position ones.
+    The intermediate results are written in the scratch buffers, so no array is allocated.
+
+    Args:
+        x: A 6D numpy array indicating the state vector, updated in place.
+        P: A 6x6 numpy matrix indicating the state covariance matrix, updated in place.
+        Q: A 6x6 numpy matrix indicating the process covariance matrix.
+        dt: A float indicating the delta time between measurements.
+        tmp3: A 3D numpy array used as scratch buffer.
+        tmp36: A 3x6 numpy matrix used as scratch buffer.
+        tmp63: A 6x3 numpy matrix used as scratch buffer.
+    """
+    # State extrapolation equation (x = F @ x)
+    np.multiply(x[3:], dt, tmp3)
+    x[:3] += tmp3
+
+    # Covariance extrapolation equation (P = F @ P @ F.T + Q)
+    np.multiply(P[3:, :], dt, tmp36)
+    P[:3, :] += tmp36
+    np.multiply(P[:, 3:], dt, tmp63)
+    P[:, :3] += tmp63
+    P += Q
+
+
+@njit(cache=True, fastmath=True)
+def _update_cv(
+        x: np.ndarray,
+        P: np.ndarray,
+        z: np.ndarray,
+        R: np.ndarray,
+        y: np.ndarray,
+        S: np.ndarray,
+        K: np.ndarray,
+        tmp6: np.ndarray,
+        tmp36: np.ndarray,
+        tmp66: np.ndarray
+) -> None:
+    """Corrects in place the state and covariance with a position measurement.
+
+    The measurement matrix H = [I, 0] is never built: H @ x is the position part of the state,
+    H @ P @ H.T is the top-left 3x3 block of P, and P @ H.T are its first three columns.
+    The intermediate results are written in the output and scratch buffers, so no array is allocated.
+
+    Args:
+        x: A 6D numpy array indicating the state vector, updated in place.
+        P: A 6x6 numpy matrix indicating the state covariance matrix, updated in place.
+        z: A 3D numpy array indicating the target position measurement [x, y, z].
+        R: A 3x3 numpy matrix indicating the sensor measurement covariance matrix.
+        y: A 3D numpy array where the measurement residual is written.
+        S: A 3x3 numpy matrix where the innovation covariance matrix is written.
+        K: A 6x3 numpy matrix where the Kalman gain is written.
+        tmp6: A 6D numpy array used as scratch buffer.
+        tmp36: A 3x6 numpy matrix used as scratch buffer.
+        tmp66: A 6x6 numpy matrix used as scratch buffer.
+    """
+    # Measurement residual (y = z - H @ x)
+    np.subtract(z, x[:3], y)
+
+    # Innovation covariance matrix (S = H @ P @ H.T + R)
+    np.add(P[:3, :3], R, S)
+
+    # Kalman gain equation (K = P @ H.T @ S^-1), solved as K @ S = P @ H.T
+    _cho_solve3(P[:, :3], S, K)
+
+    # State update equation (x = x + K @ y)
+    np.dot(K, y, tmp6)
+    x += tmp6
+
+    # Covariance update equation (P = (I - K @ H) @ P)
+    # The block of P is copied to obtain a contiguous operand for the matrix product
+    tmp36[:] = P[:3, :]
+    np.dot(K, tmp36, tmp66)
+    P -= tmp66
 
 
 class KalmanFilter:
@@ -41,26 +176,51 @@ class KalmanFilter:
     represent the object's position and velocity, while leveraging matrices to manage uncertainty
     and model the system's dynamics effectively.
 
+    The update matrix F and the measurement matrix H are constant apart from dt, so they are not
+    stored: the predict and update steps are expanded around their block structure.
+    When Numba is installed these steps are compiled to native code.
+
+    All the arrays are C-contiguous and share the floating point type chosen at construction.
+
     Attributes:
+        _dtype: A numpy dtype indicating the floating point type of the arrays.
         _x: A 6D numpy array indicating the state vector [x, y, z, v_x, v_y, v_z].
+        _pos_view: A 3D numpy view on the position components of the state vector [x, y, z].
+        _z: A 3D numpy array storing the last measurement [x, y, z].
         _P: A 6x6 numpy matrix indicating the state covariance matrix.
-        _F: A 6x6 numpy matrix indicating the update matrix.
+        _dt: A float indicating the delta time between measurements used by the update matrix.
         _Q: A 6x6 numpy matrix indicating the process covariance matrix.
         _R: A 3x3 numpy matrix indicating the sensor measurement covariance matrix.
         _y: A 3D numpy array storing the measurement residual (innovation).
         _S: A 3x3 numpy matrix indicating the innovation covariance matrix.
         _K: A 6x3 numpy matrix indicating the Kalman gain.
-        _H: A 3x6 numpy matrix indicating the measurement matrix.
+        _tmp3: A 3D numpy array used as scratch buffer.
+        _tmp6: A 6D numpy array used as scratch buffer.
+        _tmp36: A 3x6 numpy matrix used as scratch buffer.
+        _tmp63: A 6x3 numpy matrix used as scratch buffer.
+        _tmp66: A 6x6 numpy matrix used as scratch buffer.
         _noise_ax: A float indicating the acceleration noise component for the X axis.
         _noise_ay: A float indicating the acceleration noise component for the Y axis.
         _noise_az: A float indicating the acceleration noise component for the Z axis.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, dtype: type = np.float64) -> None:
         """Initializes the KalmanFilter.
+
+        Args:
+            dtype: The floating point type of the state and of the matrices. The single precision
+                np.float32 halves the memory footprint, while np.float64 is used by default.
         """
+        self._dtype = np.dtype(dtype)
+
         # State vector [x, y, z, v_x, v_y, v_z]
-        self._x = np.zeros(6)
+        self._x = np.zeros(6, dtype=self._dtype)
+
+        # The state vector is always updated in place, so the view on its position stays valid
+        self._pos_view = self._x[:3]
+
+        # Measurement vector [x, y, z], the measurements are copied in it to match the filter type
+        self._z = np.zeros(3, dtype=self._dtype)
 
         # Initializes the state covariance matrix.
         # The diagonal values of 1 for the position components [x, y, z] imply that there is
@@ -68,46 +228,35 @@ class KalmanFilter:
         # The diagonal values of 100 for the velocity components [v_x, v_y, v_z] imply that
         # there is low confidence in the initial velocity estimates (high uncertainty).
         # The off-diagonal elements are set to 0, assuming no correlation between different state variables. 
-        self._P = np.array([
-            [1, 0, 0, 0, 0, 0],
-            [0, 1, 0, 0, 0, 0],
-            [0, 0, 1, 0, 0, 0],
-            [0, 0, 0, 100, 0, 0],
-            [0, 0, 0, 0, 100, 0],
-            [0, 0, 0, 0, 0, 100]]
-        )
+        # The matrix is updated in place, so it must be a float matrix.
+        self._P = np.ascontiguousarray(np.diag([1., 1., 1., 100., 100., 100.]), dtype=self._dtype)
 
-        # Initializes the update matrix.
-        # It is set to zeros initially because it depends on the delta time between measurements.
-        self._F = np.zeros((6, 6))
+        # Initializes the delta time of the update matrix F = [[I, dt * I], [0, I]].
+        # It is set to zero initially because it depends on the delta time between measurements.
+        self._dt = 0.
 
         # Initializes the process covariance matrix.
         # This matrix represents the uncertainty in the system's process model (due to unknown accelerations).
-        # It is set to zeros initially because it depends on the delta time between measurements.
-        self._Q = np.zeros((6, 6))
+        # It is set to zeros initially because it depends on the delta time between measurements,
+        # the non-zero cells are overwritten in place.
+        self._Q = np.zeros((6, 6), dtype=self._dtype)
 
         # Initializes the sensor measurement covariance matrix.
         # The values are set to be the squared standard deviation of the measurement,
         # which is assumed to be +-30mm (depends on the sensor used).
-        self._R = np.array([
-            [0.0009, 0, 0],
-            [0, 0.0009, 0],
-            [0, 0, 0.0009]
-        ])
-
-        self._y = np.zeros(3)
-        self._S = np.zeros(3)
-        self._K = np.zeros(6)
-
-        # Initializes the measurement matrix.
-        # Maps the state vector (which includes both position and velocity) to the measurement vector.
-        # The measurement vector only contains position (x, y, z), so the corresponding velocity
-        # components in the state vector are ignored (set to 0).
-        self._H = np.array([
-            [1, 0, 0, 0, 0, 0],
-            [0, 1, 0, 0, 0, 0],
-            [0, 0, 1, 0, 0, 0]
-        ])
+        self._R = np.ascontiguousarray(np.diag([0.0009, 0.0009, 0.0009]), dtype=self._dtype)
+
+        # Output buffers of the update step
+        self._y = np.zeros(3, dtype=self._dtype)
+        self._S = np.zeros((3, 3), dtype=self._dtype)
+        self._K = np.zeros((6, 3), dtype=self._dtype)
+
+        # Scratch buffers for the intermediate results of the predict and update steps
+        self._tmp3 = np.zeros(3, dtype=self._dtype)
+        self._tmp6 = np.zeros(6, dtype=self._dtype)
+        self._tmp36 = np.zeros((3, 6), dtype=self._dtype)
+        self._tmp63 = np.zeros((6, 3), dtype=self._dtype)
+        self._tmp66 = np.zeros((6, 6), dtype=self._dtype)
 
         # Sets the acceleration noise components
         self._noise_ax = 2.
@@ -132,11 +281,13 @@ class KalmanFilter:
         """Gets the state of the tracked object.
 
         Only the position of the tracked object is required.
+        The returned array is a view on the state vector, it reflects the following
+        predict and update steps without being requested again.
 
         Returns:
             A 3D numpy array containing the tracked object position [x, y, z].
         """
-        return self._x[:3]
+        return self._pos_view
     
     def update_matrices(self, dt: float) -> None:
         """Updates the matrices that are dependent on a delta time.
@@ -151,34 +302,26 @@ class KalmanFilter:
         dt_3 = dt_2 * dt
         dt_4 = dt_3 * dt
 
-        # Updates the process covariance matrix
-        self._Q = np.array([
-            [dt_4 / 4. * self._noise_ax, 0., 0., dt_3 / 2. * self._noise_ax, 0., 0.],
-            [0., dt_4 / 4. * self._noise_ay, 0., 0., dt_3 / 2. * self._noise_ay, 0.],
-            [0., 0., dt_4 / 4. * self._noise_az, 0., 0., dt_3 / 2. * self._noise_az],
-            [dt_3 / 2. * self._noise_ax, 0., 0., dt_2 * self._noise_ax, 0., 0.],
-            [0., dt_3 / 2. * self._noise_ay, 0., 0., dt_2 * self._noise_ay, 0.],
-            [0., 0., dt_3 / 2. * self._noise_az, 0., 0., dt_2 * self._noise_az]
-        ])
+        # Updates the process covariance matrix in place.
+        # Only the diagonal and the position-velocity cells depend on dt, the other cells are always 0.
+        self._Q[0, 0] = dt_4 / 4. * self._noise_ax
+        self._Q[1, 1] = dt_4 / 4. * self._noise_ay
+        self._Q[2, 2] = dt_4 / 4. * self._noise_az
+        self._Q[3, 3] = dt_2 * self._noise_ax
+        self._Q[4, 4] = dt_2 * self._noise_ay
+        self._Q[5, 5] = dt_2 * self._noise_az
+        self._Q[0, 3] = self._Q[3, 0] = dt_3 / 2. * self._noise_ax
+        self._Q[1, 4] = self._Q[4, 1] = dt_3 / 2. * self._noise_ay
+        self._Q[2, 5] = self._Q[5, 2] = dt_3 / 2. * self._noise_az
 
         # Updates the update matrix
-        self._F = np.array([
-            [1, 0, 0, dt, 0, 0],
-            [0, 1, 0, 0, dt, 0],
-            [0, 0, 1, 0, 0, dt],
-            [0, 0, 0, 1, 0, 0],
-            [0, 0, 0, 0, 1, 0],
-            [0, 0, 0, 0, 0, 1]]
-        )
+        self._dt = dt
 
     def predict(self) -> None:
         """Estimates the future state of the tracked object.
         """
-        # State extrapolation equation
-        self._x = self._F @ self._x
-
-        # Covariance Extrapolation Equation
-        self._P = self._F @ self._P @ self._F.T + self._Q
+        # State and covariance extrapolation equations
+        _predict_cv(self._x, self._P, self._Q, self._dt, self._tmp3, self._tmp36, self._tmp63)
 
     def update(self, z: np.ndarray) -> None:
         """Corrects the estimation with the actual measurement.
@@ -189,20 +332,13 @@ class KalmanFilter:
         Args:
             z: A 3D numpy array indicating the target position measurement [x, y, z].
         """
-        # Measurement residual (innovation).
-        # Difference between the actual measurement `z` and the predicted measurement.
-        self._y = z - self._H @ self._x
-
-        # Innovation covariance matrix.
-        self._S = self._H @ self._P @ self._H.T + self._R
-
-        # Kalman gain equation
-        self._K = self._P @ self._H.T @ np.linalg.inv(self._S)
-
-        I = np.eye(6)
-
-        # State update equation
-        self._x = self._x + self._K @ self._y
-
-        # Covariance update equation
-        self._P = (I - self._K @ self._H) @ self._P
+        # Copies the measurement, so that all the operands of the kernel have the same type
+        self._z[:] = z
+
+        # Measurement residual (innovation), innovation covariance matrix, Kalman gain,
+        # state and covariance update equations
+        _update_cv(
+            self._x, self._P, self._z, self._R,
+            self._y, self._S, self._K,
+            self._tmp6, self._tmp36, self._tmp66
+        )
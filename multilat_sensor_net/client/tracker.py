@@ -17,7 +17,7 @@ Usage Example:
     pred_pos = obj.get_predicted_position() # Output: array([4.5, 2.5, 1.5])
 """
 
-from multilat_sensor_net.client import KalmanFilter
+from .kalman_filter import KalmanFilter
 import numpy as np
 import time
 
@@ -32,7 +32,9 @@ class Tracker:
         _kalman: A KalmanFilter instance for estimating the target position.
         _is_initialized: A bool used to check for initialization of the tracked object.
         _prev_time: A float indicating the previous timestamp to update the Kalman Filter matrices.
+            It is taken from the monotonic performance counter, so dt is not affected by clock jumps.
         _pred_pos: A 3D numpy array indicating the tracked object position [x, y, z].
+            It is a view on the Kalman Filter state, updated in place at every step.
     """
 
     def __init__(self) -> None:
@@ -44,36 +46,45 @@ class Tracker:
 
         # Tracker attributes
         self._is_initialized = False
-        self._prev_time = time.time()
-        self._pred_pos = None
+        self._prev_time = time.perf_counter()
+        self._pred_pos = self._kalman.get_state()
 
     def tracker_core(self, measurement: np.array) -> None:
         """Executes the logic of the tracker.
 
+        The first measurement initializes the tracked object state, the following ones
+        are used to predict and update it.
+
         Args:
             measurement: A 3D numpy array containing the measured target position.
+                Its values are copied, so the caller can reuse the array.
         """
-        # Checks if the kalman filter has been already initialized
+        # Binds the Kalman Filter to a local name to avoid repeated attribute lookups
+        kalman = self._kalman
+
+        # Checks if the kalman filter has been already initialized.
+        # The first measurement only initializes the state, the time elapsed since the
+        # creation of the tracker is not a valid dt for the prediction.
         if not self._is_initialized:
             self._is_initialized = True
-            self._kalman.set_state(measurement)
+            kalman.set_state(measurement)
+            self._prev_time = time.perf_counter()
+            return
 
         # Computes dt
-        curr_time = time.time()
+        curr_time = time.perf_counter()
         dt = curr_time - self._prev_time
         self._prev_time = curr_time
 
         # Updates the matrices
-        self._kalman.update_matrices(dt)
+        kalman.update_matrices(dt)
 
         # Predicts the future position of the target
-        self._kalman.predict()
+        kalman.predict()
 
-        # Updates the prediction with the measurement from the distributed network
-        self._kalman.update(measurement)
-
-        # Gets the estimated position and records it
-        self._pred_pos = self._kalman.get_state()
+        # Updates the prediction with the measurement from the distributed network.
+        # The estimated position is recorded in place in the predicted position view.
+        kalman.update(measurement)
 
     def get_predicted_position(self) -> np.array:
         """Gets the predicted target position.
@@ -0,0 +1,13 @@
+"""Common Package.
+
+This package provides classes and modules shared by the components of the sensor network.
+
+Modules:
+    channel_cache: Defines the ChannelCache class for sharing gRPC channels within a process.
+"""
+
+from .channel_cache import ChannelCache
+
+__all__ = [
+    "ChannelCache",
+]
@@ -0,0 +1,64 @@
+"""This module implements the ChannelCache class.
+
+The ChannelCache class provides a process-wide cache of gRPC channels. The components that
+communicate with the same service address share a single channel, so the TCP connection and
+the HTTP/2 handshake are performed only once per process.
+
+Classes:
+    ChannelCache: ChannelCache class for sharing gRPC channels within a process.
+
+Usage Example:
+    from multilat_sensor_net.common import ChannelCache
+    from multilat_sensor_net.generated import target_pb2_grpc
+
+    channel = ChannelCache.get_channel("localhost:50051")
+    stub = target_pb2_grpc.TargetStub(channel)
+"""
+
+import threading as th
+import grpc
+
+
+class ChannelCache:
+    """ChannelCache class for sharing gRPC channels within a process.
+
+    This class stores the insecure gRPC channels created by the process, indexed by
+    service address and channel options. The channels are created on first request
+    and are never closed, they last until the process terminates.
+
+    The class is thread-safe, the channels can be requested by multiple threads.
+
+    Attributes:
+        _channels: A dict mapping the (address, options) pairs to the related gRPC channels.
+        _mutex: A threading mutex used to lock the creation of the channels.
+    """
+
+    _channels = {}
+    _mutex = th.Lock()
+
+    @classmethod
+    def get_channel(cls, service_addr: str, options: tuple = ()) -> grpc.Channel:
+        """Gets the gRPC channel for a service address, creating it on first request.
+
+        Args:
+            service_addr: The socket address (e.g., "localhost:50051") of the gRPC server.
+            options: A tuple of (key, value) pairs containing the gRPC channel options.
+
+        Returns:
+            The shared gRPC channel for the service address and the options.
+        """
+        key = (service_addr, tuple(options))
+
+        # Fast path, the channel already exists and the dict read is atomic
+        channel = cls._channels.get(key)
+        if channel is not None:
+            return channel
+
+        with cls._mutex:
+            # Checks again, another thread could have created the channel in the meantime
+            channel = cls._channels.get(key)
+            if channel is None:
+                channel = grpc.insecure_channel(service_addr, options=list(options))
+                cls._channels[key] = channel
+
+        return channel
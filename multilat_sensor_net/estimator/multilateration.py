@@ -46,8 +46,13 @@ class Multilateration:
     Attributes:
         verbose: A boolean flag that enables logging for debugging purposes. If True, detailed
             logs about actions performed by the components will be printed to the console.
-        _sensor_positions: A dictionary mapping sensor IDs to their 3D positions as numpy arrays.
+        _sensor_ids: A list containing the sensor IDs, ordered as the rows of the positions matrix.
+        _sensor_xyz: A Nx3 numpy matrix containing the 3D positions of the sensors.
+        _sensor_sq: A N numpy array containing the squared norms of the sensor positions.
+        _sensor_normal: A numpy array containing the unit normal of the plane of the sensors,
+            or None when the sensors are not coplanar.
         _initial_guess: A numpy array representing the initial guess for the target's position.
+            It is the previous estimate, or the linearized solution when enough measurements are available.
     """
     
     def __init__(self, verbose: bool) -> None:
@@ -56,7 +61,10 @@ class Multilateration:
         Args:
             verbose: Flag indicating whether the classes must produce an output.
         """
-        self._sensor_positions = {}
+        self._sensor_ids = []
+        self._sensor_xyz = np.empty((0, 3))
+        self._sensor_sq = np.empty(0)
+        self._sensor_normal = None
         self._initial_guess = np.array([0., 0., 0.])
 
         # Logging attributes
@@ -65,44 +73,159 @@ class Multilateration:
     def set_sensor_positions(self, nodes_info: dict) -> None:
         """Sets the positions of the sensors based on the provided node information.
 
+        The positions are stored as a single matrix, so that the residuals of all the sensors
+        are computed with one vectorized operation.
+
         Args:
             nodes_info: A dictionary where each key is a sensor ID and the value is
                 a tuple containing the sensor's 3D position as a numpy array.
         """
-        for node_data in nodes_info.items():
-            # Extract the values
-            node_id = node_data[0]
-            node_pos = node_data[1][0]
+        # Extracts the sensor IDs and the related positions, the row i of the matrix is the sensor i
+        sensor_xyz = np.array(
+            [node_info[0] for node_info in nodes_info.values()],
+            dtype=np.float64
+        ).reshape(-1, 3)
+
+        self.set_sensor_matrix(sensor_ids=list(nodes_info.keys()), sensor_xyz=sensor_xyz)
+
+    def set_sensor_matrix(self, sensor_ids, sensor_xyz: np.ndarray) -> None:
+        """Sets the positions of the sensors from a positions matrix.
+
+        Args:
+            sensor_ids: A sequence containing the sensor IDs.
+            sensor_xyz: A Nx3 numpy matrix where the row i is the 3D position of the i-th sensor ID.
+                The matrix is not copied, it is only read by the estimator.
+        """
+        self._sensor_ids = list(sensor_ids)
+        self._sensor_xyz = sensor_xyz
+
+        # Squared norms of the sensor positions used by the linearized solver
+        self._sensor_sq = np.einsum('ij,ij->i', self._sensor_xyz, self._sensor_xyz)
+
+        # Normal of the plane of the sensors, e.g. when all the sensors are mounted on the floor
+        self._sensor_normal = self._plane_normal(self._sensor_xyz)
+
+    @staticmethod
+    def _plane_normal(sensor_xyz: np.ndarray):
+        """Computes the normal of the plane containing all the sensors.
+
+        Args:
+            sensor_xyz: A Nx3 numpy matrix containing the 3D positions of the sensors.
+
+        Returns:
+            A unit numpy array normal to the plane of the sensors, oriented so that its largest
+            component is positive (e.g. upwards for sensors on the floor), or None if the sensors
+            are less than 3, collinear, or not coplanar.
+        """
+        # Edge case
+        if sensor_xyz.shape[0] < 3:
+            return None
+
+        # The right singular vector of the smallest singular value is the direction
+        # of least spread of the sensors around their centroid
+        _, s, vt = np.linalg.svd(sensor_xyz - sensor_xyz.mean(axis=0), full_matrices=False)
 
-            self._sensor_positions[node_id] = node_pos
+        # Edge case
+        # The sensors are not coplanar, or they are collinear and the plane is not unique
+        tol = 1e-9 * s[0]
+        if s[2] > tol or s[1] <= tol:
+            return None
 
-    def estimate_position(self, distances: dict) -> np.array:
+        normal = vt[2]
+        if normal[np.argmax(np.abs(normal))] < 0:
+            normal = -normal
+
+        return normal
+
+    def estimate_position(self, distances) -> np.array:
         """Estimates the target position based on sensor measurements.
 
         This method uses a nonlinear least squares approach to minimize the residuals
-        between the predicted and measured distances from each sensor.
+        between the predicted and measured distances from each sensor, with the
+        Levenberg-Marquardt algorithm and an analytic Jacobian. The optimization starts
+        from the closed-form solution of the linearized problem when enough measurements
+        are available.
 
         Args:
-            distances: A dictionary mapping sensor IDs to measured distances from the target.
+            distances: A N numpy array containing the measured distances from the target, aligned
+                to the rows of the positions matrix, with NaN for the missing measurements.
+                A dictionary mapping sensor IDs to measured distances is also accepted.
 
         Returns:
             A numpy array representing the estimated 3D position of the target.
         """
+        # Aligns the measured distances to the sensor positions matrix,
+        # an array is already aligned so the per-sensor lookup is only needed for a dictionary
+        if isinstance(distances, dict):
+            measured = np.fromiter(
+                (distances.get(sensor_id, np.nan) for sensor_id in self._sensor_ids),
+                dtype=np.float64,
+                count=len(self._sensor_ids)
+            )
+        else:
+            measured = distances
+
+        # The sensors without a measurement are discarded
+        mask = ~np.isnan(measured)
+        if mask.all():
+            sensor_xyz = self._sensor_xyz
+            sensor_sq = self._sensor_sq
+        else:
+            sensor_xyz = self._sensor_xyz[mask]
+            sensor_sq = self._sensor_sq[mask]
+            measured = measured[mask]
+
+        # Normal of the plane of the measuring sensors, when they are coplanar
+        normal = self._sensor_normal if mask.all() else self._plane_normal(sensor_xyz)
+
+        # With at least 4 measurements the initial guess is computed in closed form.
+        # Subtracting the equation of the first sensor from the others removes the quadratic
+        # term ||pos||^2, so that 2 * (p_i - p_0) @ pos = d_0^2 - d_i^2 + ||p_i||^2 - ||p_0||^2
+        # is a linear system solved in the least squares sense.
+        # Otherwise the previous estimate is used as initial guess.
+        if len(measured) >= 4:
+            A = 2. * (sensor_xyz[1:] - sensor_xyz[0])
+            b = measured[0] ** 2 - measured[1:] ** 2 + sensor_sq[1:] - sensor_sq[0]
+            solution, _, rank, _ = np.linalg.lstsq(A, b, rcond=None)
+
+            if rank == 3:
+                self._initial_guess = solution
+            elif normal is not None:
+                # The sensors are coplanar, the system only fixes the position within their plane.
+                # The offset t along the normal is recovered from the sphere of the first sensor,
+                # ||solution + t * normal - p_0||^2 = d_0^2, taking the root on the side of the previous estimate.
+                rel = solution - sensor_xyz[0]
+                proj = rel @ normal
+                half_chord = np.sqrt(max(proj ** 2 - rel @ rel + measured[0] ** 2, 0.))
+                side = 1. if (self._initial_guess - sensor_xyz[0]) @ normal >= 0. else -1.
+                self._initial_guess = solution + (side * half_chord - proj) * normal
+
+        # When the sensors are coplanar, the Jacobian at a guess lying on their plane has no component
+        # along the normal, so the solver could never leave the plane. Such a guess is moved off the plane
+        # by the mean measured distance, on the side of the normal.
+        if normal is not None and abs((self._initial_guess - sensor_xyz[0]) @ normal) < 1e-6:
+            self._initial_guess = self._initial_guess + measured.mean() * normal
+
         # Define an objective function that returns the residual vector.
         # For each sensor i, residual_i = ||pos - p_i|| - d_i
         # least_squares automatically sums the squares of these residuals.
         def objective_function(pos):
-            residuals = []
-            for sensor_id, sensor_pos in self._sensor_positions.items():
-                if sensor_id in distances:
-                    measured_distance = distances[sensor_id]
-                    # Computes the Euclidean distance from the current guess to sensor_pos
-                    predicted_distance = np.linalg.norm(pos - sensor_pos)
-                    residuals.append(predicted_distance - measured_distance)
-            return residuals
+            return np.linalg.norm(pos - sensor_xyz, axis=1) - measured
+
+        # Define the Jacobian of the residual vector.
+        # For each sensor i, d(residual_i)/d(pos) = (pos - p_i) / ||pos - p_i||
+        # The norm is bounded to avoid a division by zero when the guess is on a sensor.
+        def jacobian(pos):
+            diff = pos - sensor_xyz
+            norms = np.maximum(np.linalg.norm(diff, axis=1), 1e-12)
+            return diff / norms[:, None]
+
+        # Levenberg-Marquardt is faster on this small problem, but it requires at least
+        # as many residuals as unknowns, otherwise the trust region reflective method is used
+        method = 'lm' if len(measured) >= 3 else 'trf'
 
         # Minimizes the objective function to estimate the object's position
-        result = least_squares(objective_function, self._initial_guess)
+        result = least_squares(objective_function, self._initial_guess, jac=jacobian, method=method)
 
         # Extracts the optimized position and updates the initial guess for future runs
         self._initial_guess = result.x
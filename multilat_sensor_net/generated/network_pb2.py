@@ -22,31 +22,35 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rnetwork.proto\x12\x07network\"\"\n\rTargetRequest\x12\x11\n\tclient_id\x18\x01 \x01(\x05\"X\n\x0eTargetResponse\x12%\n\x06status\x18\x01 \x01(\x0e\x32\x15.network.TargetStatus\x12\t\n\x01x\x18\x02 \x01(\x02\x12\t\n\x01y\x18\x03 \x01(\x02\x12\t\n\x01z\x18\x04 \x01(\x02\"U\n\x0bNodeRequest\x12\x0f\n\x07node_id\x18\x01 \x01(\x05\x12\t\n\x01x\x18\x02 \x01(\x02\x12\t\n\x01y\x18\x03 \x01(\x02\x12\t\n\x01z\x18\x04 \x01(\x02\x12\x14\n\x0c\x62ind_address\x18\x05 \x01(\t\"3\n\x0cNodeResponse\x12#\n\x06status\x18\x01 \x01(\x0e\x32\x13.network.NodeStatus\"!\n\x0cStartRequest\x12\x11\n\tclient_id\x18\x01 \x01(\x05\"C\n\rStartResponse\x12!\n\x06status\x18\x01 \x01(\x0e\x32\x11.network.SNStatus\x12\x0f\n\x07n_nodes\x18\x02 \x01(\x05*7\n\x0cTargetStatus\x12\x0e\n\nTS_UNKNOWN\x10\x00\x12\t\n\x05TS_OK\x10\x01\x12\x0c\n\x08TS_ERROR\x10\x02*5\n\nNodeStatus\x12\x0e\n\nNS_UNKNOWN\x10\x00\x12\t\n\x05NS_OK\x10\x01\x12\x0c\n\x08NS_ERROR\x10\x02*3\n\x08SNStatus\x12\x0e\n\nSS_UNKNOWN\x10\x00\x12\t\n\x05SS_OK\x10\x01\x12\x0c\n\x08SS_ERROR\x10\x02\x32\xd2\x01\n\x07Network\x12\x38\n\x07\x41\x64\x64Node\x12\x14.network.NodeRequest\x1a\x15.network.NodeResponse\"\x00\x12?\n\x0cStartNetwork\x12\x15.network.StartRequest\x1a\x16.network.StartResponse\"\x00\x12L\n\x17GetTargetGlobalPosition\x12\x16.network.TargetRequest\x1a\x17.network.TargetResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rnetwork.proto\x12\x07network\"0\n\rTargetRequest\x12\x11\n\tclient_id\x18\x01 \x01(\x05\x12\x0c\n\x04\x66req\x18\x02 \x01(\x02\"V\n\x0eTargetResponse\x12%\n\x06status\x18\x01 \x01(\x0e\x32\x15.network.TargetStatus\x12\x0b\n\x03pos\x18\x05 \x01(\x0cJ\x04\x08\x02\x10\x03J\x04\x08\x03\x10\x04J\x04\x08\x04\x10\x05\"U\n\x0bNodeRequest\x12\x0f\n\x07node_id\x18\x01 \x01(\x05\x12\t\n\x01x\x18\x02 \x01(\x02\x12\t\n\x01y\x18\x03 \x01(\x02\x12\t\n\x01z\x18\x04 \x01(\x02\x12\x14\n\x0c\x62ind_address\x18\x05 \x01(\t\"3\n\x0cNodeResponse\x12#\n\x06status\x18\x01 \x01(\x0e\x32\x13.network.NodeStatus\"3\n\x0cNodesRequest\x12#\n\x05nodes\x18\x01 \x03(\x0b\x32\x14.network.NodeRequest\"4\n\rNodesResponse\x12#\n\x06status\x18\x01 \x03(\x0e\x32\x13.network.NodeStatus\"!\n\x0cStartRequest\x12\x11\n\tclient_id\x18\x01 \x01(\x05\"C\n\rStartResponse\x12!\n\x06status\x18\x01 \x01(\x0e\x32\x11.network.SNStatus\x12\x0f\n\x07n_nodes\x18\x02 \x01(\x05*7\n\x0cTargetStatus\x12\x0e\n\nTS_UNKNOWN\x10\x00\x12\t\n\x05TS_OK\x10\x01\x12\x0c\n\x08TS_ERROR\x10\x02*5\n\nNodeStatus\x12\x0e\n\nNS_UNKNOWN\x10\x00\x12\t\n\x05NS_OK\x10\x01\x12\x0c\n\x08NS_ERROR\x10\x02*3\n\x08SNStatus\x12\x0e\n\nSS_UNKNOWN\x10\x00\x12\t\n\x05SS_OK\x10\x01\x12\x0c\n\x08SS_ERROR\x10\x02\x32\x91\x02\n\x07Network\x12\x38\n\x07\x41\x64\x64Node\x12\x14.network.NodeRequest\x1a\x15.network.NodeResponse\"\x00\x12;\n\x08\x41\x64\x64Nodes\x12\x15.network.NodesRequest\x1a\x16.network.NodesResponse\"\x00\x12?\n\x0cStartNetwork\x12\x15.network.StartRequest\x1a\x16.network.StartResponse\"\x00\x12N\n\x17GetTargetGlobalPosition\x12\x16.network.TargetRequest\x1a\x17.network.TargetResponse\"\x00\x30\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'network_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_TARGETSTATUS']._serialized_start=396
-  _globals['_TARGETSTATUS']._serialized_end=451
-  _globals['_NODESTATUS']._serialized_start=453
-  _globals['_NODESTATUS']._serialized_end=506
-  _globals['_SNSTATUS']._serialized_start=508
-  _globals['_SNSTATUS']._serialized_end=559
+  _globals['_TARGETSTATUS']._serialized_start=515
+  _globals['_TARGETSTATUS']._serialized_end=570
+  _globals['_NODESTATUS']._serialized_start=572
+  _globals['_NODESTATUS']._serialized_end=625
+  _globals['_SNSTATUS']._serialized_start=627
+  _globals['_SNSTATUS']._serialized_end=678
   _globals['_TARGETREQUEST']._serialized_start=26
-  _globals['_TARGETREQUEST']._serialized_end=60
-  _globals['_TARGETRESPONSE']._serialized_start=62
-  _globals['_TARGETRESPONSE']._serialized_end=150
-  _globals['_NODEREQUEST']._serialized_start=152
-  _globals['_NODEREQUEST']._serialized_end=237
-  _globals['_NODERESPONSE']._serialized_start=239
-  _globals['_NODERESPONSE']._serialized_end=290
-  _globals['_STARTREQUEST']._serialized_start=292
-  _globals['_STARTREQUEST']._serialized_end=325
-  _globals['_STARTRESPONSE']._serialized_start=327
-  _globals['_STARTRESPONSE']._serialized_end=394
-  _globals['_NETWORK']._serialized_start=562
-  _globals['_NETWORK']._serialized_end=772
+  _globals['_TARGETREQUEST']._serialized_end=74
+  _globals['_TARGETRESPONSE']._serialized_start=76
+  _globals['_TARGETRESPONSE']._serialized_end=162
+  _globals['_NODEREQUEST']._serialized_start=164
+  _globals['_NODEREQUEST']._serialized_end=249
+  _globals['_NODERESPONSE']._serialized_start=251
+  _globals['_NODERESPONSE']._serialized_end=302
+  _globals['_NODESREQUEST']._serialized_start=304
+  _globals['_NODESREQUEST']._serialized_end=355
+  _globals['_NODESRESPONSE']._serialized_start=357
+  _globals['_NODESRESPONSE']._serialized_end=409
+  _globals['_STARTREQUEST']._serialized_start=411
+  _globals['_STARTREQUEST']._serialized_end=444
+  _globals['_STARTRESPONSE']._serialized_start=446
+  _globals['_STARTRESPONSE']._serialized_end=513
+  _globals['_NETWORK']._serialized_start=681
+  _globals['_NETWORK']._serialized_end=954
 # @@protoc_insertion_point(module_scope)
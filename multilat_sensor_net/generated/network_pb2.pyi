@@ -1,7 +1,8 @@
+from google.protobuf.internal import containers as _containers
 from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Mapping, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
@@ -33,22 +34,20 @@ SS_OK: SNStatus
 SS_ERROR: SNStatus
 
 class TargetRequest(_message.Message):
-    __slots__ = ("client_id",)
+    __slots__ = ("client_id", "freq")
     CLIENT_ID_FIELD_NUMBER: _ClassVar[int]
+    FREQ_FIELD_NUMBER: _ClassVar[int]
     client_id: int
-    def __init__(self, client_id: _Optional[int] = ...) -> None: ...
+    freq: float
+    def __init__(self, client_id: _Optional[int] = ..., freq: _Optional[float] = ...) -> None: ...
 
 class TargetResponse(_message.Message):
-    __slots__ = ("status", "x", "y", "z")
+    __slots__ = ("status", "pos")
     STATUS_FIELD_NUMBER: _ClassVar[int]
-    X_FIELD_NUMBER: _ClassVar[int]
-    Y_FIELD_NUMBER: _ClassVar[int]
-    Z_FIELD_NUMBER: _ClassVar[int]
+    POS_FIELD_NUMBER: _ClassVar[int]
     status: TargetStatus
-    x: float
-    y: float
-    z: float
-    def __init__(self, status: _Optional[_Union[TargetStatus, str]] = ..., x: _Optional[float] = ..., y: _Optional[float] = ..., z: _Optional[float] = ...) -> None: ...
+    pos: bytes
+    def __init__(self, status: _Optional[_Union[TargetStatus, str]] = ..., pos: _Optional[bytes] = ...) -> None: ...
 
 class NodeRequest(_message.Message):
     __slots__ = ("node_id", "x", "y", "z", "bind_address")
@@ -70,6 +69,18 @@ class NodeResponse(_message.Message):
     status: NodeStatus
     def __init__(self, status: _Optional[_Union[NodeStatus, str]] = ...) -> None: ...
 
+class NodesRequest(_message.Message):
+    __slots__ = ("nodes",)
+    NODES_FIELD_NUMBER: _ClassVar[int]
+    nodes: _containers.RepeatedCompositeFieldContainer[NodeRequest]
+    def __init__(self, nodes: _Optional[_Iterable[_Union[NodeRequest, _Mapping]]] = ...) -> None: ...
+
+class NodesResponse(_message.Message):
+    __slots__ = ("status",)
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    status: _containers.RepeatedScalarFieldContainer[NodeStatus]
+    def __init__(self, status: _Optional[_Iterable[_Union[NodeStatus, str]]] = ...) -> None: ...
+
 class StartRequest(_message.Message):
     __slots__ = ("client_id",)
     CLIENT_ID_FIELD_NUMBER: _ClassVar[int]
@@ -41,12 +41,17 @@ class NetworkStub(object):
                 request_serializer=network__pb2.NodeRequest.SerializeToString,
                 response_deserializer=network__pb2.NodeResponse.FromString,
                 _registered_method=True)
+        self.AddNodes = channel.unary_unary(
+                '/network.Network/AddNodes',
+                request_serializer=network__pb2.NodesRequest.SerializeToString,
+                response_deserializer=network__pb2.NodesResponse.FromString,
+                _registered_method=True)
         self.StartNetwork = channel.unary_unary(
                 '/network.Network/StartNetwork',
                 request_serializer=network__pb2.StartRequest.SerializeToString,
                 response_deserializer=network__pb2.StartResponse.FromString,
                 _registered_method=True)
-        self.GetTargetGlobalPosition = channel.unary_unary(
+        self.GetTargetGlobalPosition = channel.unary_stream(
                 '/network.Network/GetTargetGlobalPosition',
                 request_serializer=network__pb2.TargetRequest.SerializeToString,
                 response_deserializer=network__pb2.TargetResponse.FromString,
@@ -65,6 +70,13 @@ class NetworkServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def AddNodes(self, request, context):
+        """RPC method to add a batch of nodes to the distributed network with a single call.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def StartNetwork(self, request, context):
         """RPC method to start the distributed network.
         """
@@ -73,7 +85,7 @@ class NetworkServicer(object):
         raise NotImplementedError('Method not implemented!')
 
     def GetTargetGlobalPosition(self, request, context):
-        """RPC method for requesting the global position of the target in a 3D space.
+        """RPC method for streaming the global position of the target in a 3D space.
         """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
@@ -87,12 +99,17 @@ def add_NetworkServicer_to_server(servicer, server):
                     request_deserializer=network__pb2.NodeRequest.FromString,
                     response_serializer=network__pb2.NodeResponse.SerializeToString,
             ),
+            'AddNodes': grpc.unary_unary_rpc_method_handler(
+                    servicer.AddNodes,
+                    request_deserializer=network__pb2.NodesRequest.FromString,
+                    response_serializer=network__pb2.NodesResponse.SerializeToString,
+            ),
             'StartNetwork': grpc.unary_unary_rpc_method_handler(
                     servicer.StartNetwork,
                     request_deserializer=network__pb2.StartRequest.FromString,
                     response_serializer=network__pb2.StartResponse.SerializeToString,
             ),
-            'GetTargetGlobalPosition': grpc.unary_unary_rpc_method_handler(
+            'GetTargetGlobalPosition': grpc.unary_stream_rpc_method_handler(
                     servicer.GetTargetGlobalPosition,
                     request_deserializer=network__pb2.TargetRequest.FromString,
                     response_serializer=network__pb2.TargetResponse.SerializeToString,
@@ -137,6 +154,33 @@ class Network(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def AddNodes(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/network.Network/AddNodes',
+            network__pb2.NodesRequest.SerializeToString,
+            network__pb2.NodesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def StartNetwork(request,
             target,
@@ -175,7 +219,7 @@ class Network(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(
+        return grpc.experimental.unary_stream(
             request,
             target,
             '/network.Network/GetTargetGlobalPosition',
@@ -22,19 +22,21 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0ctarget.proto\x12\x06target\"%\n\x12GetPositionRequest\x12\x0f\n\x07node_id\x18\x01 \x01(\x05\"^\n\x13GetPositionResponse\x12&\n\x06status\x18\x01 \x01(\x0e\x32\x16.target.PositionStatus\x12\t\n\x01x\x18\x02 \x01(\x02\x12\t\n\x01y\x18\x03 \x01(\x02\x12\t\n\x01z\x18\x04 \x01(\x02*9\n\x0ePositionStatus\x12\x0e\n\nPS_UNKNOWN\x10\x00\x12\t\n\x05PS_OK\x10\x01\x12\x0c\n\x08PS_ERROR\x10\x02\x32R\n\x06Target\x12H\n\x0bGetPosition\x12\x1a.target.GetPositionRequest\x1a\x1b.target.GetPositionResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0ctarget.proto\x12\x06target\"%\n\x12GetPositionRequest\x12\x0f\n\x07node_id\x18\x01 \x01(\x05\"6\n\x15StreamPositionRequest\x12\x0f\n\x07node_id\x18\x01 \x01(\x05\x12\x0c\n\x04\x66req\x18\x02 \x01(\x02\"^\n\x13GetPositionResponse\x12&\n\x06status\x18\x01 \x01(\x0e\x32\x16.target.PositionStatus\x12\t\n\x01x\x18\x02 \x01(\x02\x12\t\n\x01y\x18\x03 \x01(\x02\x12\t\n\x01z\x18\x04 \x01(\x02*9\n\x0ePositionStatus\x12\x0e\n\nPS_UNKNOWN\x10\x00\x12\t\n\x05PS_OK\x10\x01\x12\x0c\n\x08PS_ERROR\x10\x02\x32\xa4\x01\n\x06Target\x12H\n\x0bGetPosition\x12\x1a.target.GetPositionRequest\x1a\x1b.target.GetPositionResponse\"\x00\x12P\n\x0eStreamPosition\x12\x1d.target.StreamPositionRequest\x1a\x1b.target.GetPositionResponse\"\x00\x30\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'target_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_POSITIONSTATUS']._serialized_start=159
-  _globals['_POSITIONSTATUS']._serialized_end=216
+  _globals['_POSITIONSTATUS']._serialized_start=215
+  _globals['_POSITIONSTATUS']._serialized_end=272
   _globals['_GETPOSITIONREQUEST']._serialized_start=24
   _globals['_GETPOSITIONREQUEST']._serialized_end=61
-  _globals['_GETPOSITIONRESPONSE']._serialized_start=63
-  _globals['_GETPOSITIONRESPONSE']._serialized_end=157
-  _globals['_TARGET']._serialized_start=218
-  _globals['_TARGET']._serialized_end=300
+  _globals['_STREAMPOSITIONREQUEST']._serialized_start=63
+  _globals['_STREAMPOSITIONREQUEST']._serialized_end=117
+  _globals['_GETPOSITIONRESPONSE']._serialized_start=119
+  _globals['_GETPOSITIONRESPONSE']._serialized_end=213
+  _globals['_TARGET']._serialized_start=275
+  _globals['_TARGET']._serialized_end=439
 # @@protoc_insertion_point(module_scope)
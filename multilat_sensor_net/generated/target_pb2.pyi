@@ -20,6 +20,14 @@ class GetPositionRequest(_message.Message):
     node_id: int
     def __init__(self, node_id: _Optional[int] = ...) -> None: ...
 
+class StreamPositionRequest(_message.Message):
+    __slots__ = ("node_id", "freq")
+    NODE_ID_FIELD_NUMBER: _ClassVar[int]
+    FREQ_FIELD_NUMBER: _ClassVar[int]
+    node_id: int
+    freq: float
+    def __init__(self, node_id: _Optional[int] = ..., freq: _Optional[float] = ...) -> None: ...
+
 class GetPositionResponse(_message.Message):
     __slots__ = ("status", "x", "y", "z")
     STATUS_FIELD_NUMBER: _ClassVar[int]
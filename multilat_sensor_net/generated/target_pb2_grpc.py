@@ -41,6 +41,11 @@ class TargetStub(object):
                 request_serializer=target__pb2.GetPositionRequest.SerializeToString,
                 response_deserializer=target__pb2.GetPositionResponse.FromString,
                 _registered_method=True)
+        self.StreamPosition = channel.unary_stream(
+                '/target.Target/StreamPosition',
+                request_serializer=target__pb2.StreamPositionRequest.SerializeToString,
+                response_deserializer=target__pb2.GetPositionResponse.FromString,
+                _registered_method=True)
 
 
 class TargetServicer(object):
@@ -55,6 +60,13 @@ class TargetServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamPosition(self, request, context):
+        """RPC method for streaming the position of a target object at a given frequency.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_TargetServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -63,6 +75,11 @@ def add_TargetServicer_to_server(servicer, server):
                     request_deserializer=target__pb2.GetPositionRequest.FromString,
                     response_serializer=target__pb2.GetPositionResponse.SerializeToString,
             ),
+            'StreamPosition': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamPosition,
+                    request_deserializer=target__pb2.StreamPositionRequest.FromString,
+                    response_serializer=target__pb2.GetPositionResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'target.Target', rpc_method_handlers)
@@ -102,3 +119,30 @@ class Target(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def StreamPosition(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/target.Target/StreamPosition',
+            target__pb2.StreamPositionRequest.SerializeToString,
+            target__pb2.GetPositionResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -18,8 +18,11 @@ Usage Example:
     obj.start()
 """
 
-from multilat_sensor_net.network import NetworkData, NetworkService, NetworkDealer
+from .network_data import NetworkData
+from .network_service import NetworkService
+from .network_dealer import NetworkDealer
 from multilat_sensor_net.estimator import Multilateration
+import asyncio
 
 
 class NetworkController:
@@ -65,5 +68,10 @@ class NetworkController:
 
     def start(self) -> None:
         """Starts the network controller's service.
+
+        The service runs on an asyncio event loop until a keyboard interrupt is identified.
         """
-        self.service.serve()
+        try:
+            asyncio.run(self.service.serve())
+        except KeyboardInterrupt:
+            pass
@@ -22,11 +22,15 @@ Usage Example:
 
     is_active = obj.get_is_active()  # Output: True
     nodes = obj.get_nodes_info()    # Output: {1: (array([0., 0., 0.]), 'tcp://localhost:5551')}
+    node_ids, positions = obj.get_positions_matrix()    # Output: (1,), array([[0., 0., 0.]])
 """
 
 import threading as th
 import numpy as np
-import copy
+
+
+# Initial number of rows of the positions buffer, it is doubled when full
+_INITIAL_CAPACITY = 16
 
 
 class NetworkData:
@@ -37,27 +41,26 @@ class NetworkData:
 
     This class is thread-safe and provides a balanced way for readers and writers
     to call the related methods without incurring in starvation and deadlock.
+    The nodes are rarely modified after the network is started, so they are stored
+    as a copy-on-write snapshot that the readers access without synchronization.
 
     Attributes:
         _nodes: A dict containing information about connected nodes,
             including their positions and addresses {e.g., node_id: (node_pos, node_address)}.
+            It is a snapshot that is never modified, the writers replace it with an updated copy.
+        _positions: A tuple containing the node IDs and a read-only Nx3 numpy matrix with the
+            related positions, the row i is the position of the i-th node ID.
+            It is a snapshot that is replaced together with the nodes dict.
+        _buffer: A preallocated Mx3 numpy matrix, with M >= N, where the positions are appended.
+            The positions matrix and the positions in the nodes dict are read-only views of its rows,
+            the rows already published are never written again.
         _is_active: A bool indicating whether the network is active or inactive.
-        _synch_nodes_r: A threading semaphore used to handle requests from multiple
-            reader threads for nodes methods.
-        _synch_nodes_w: A threading semaphore used to handler requests from multiple
-            writer threads for nodes methods.
-        _mutex_nodes: A threading mutex used to lock critical sections of the code for nodes methods.
-        _blocked_nodes_r: An integer count of the blocked reader threads for nodes methods.
-        _blocked_nodes_w: An integer count of the blocked writer threads for nodes methods.
-        _running_nodes_r: An integer count of the running reader threads for nodes methods.
-        _running_nodes_w: An integer count of the running writer threads for nodes methods.
-        _synch_active_r: A threading semaphore used to handle requests from multiple
-            reader threads for active methods.
-        _synch_active_w: A threading semaphore used to handler requests from multiple
-            writer threads for active methods.
-        _mutex_active: A threading mutex used to lock critical sections of the code for active methods.
-        _blocked_active_r: An integer count of the blocked reader threads for active methods.
-        _blocked_active_w: An integer count of the blocked writer threads for active methods.
+        _mutex_nodes: A threading mutex used to serialize the writer threads for nodes methods.
+        _cv_active: A threading condition used to synchronize reader and writer threads for active methods.
+        _waiting_active_r: An integer count of the waiting reader threads for active methods.
+        _waiting_active_w: An integer count of the waiting writer threads for active methods.
+        _admitted_active_r: An integer count of the waiting reader threads admitted by the last writer
+            thread for active methods, they run before the next writer thread.
         _running_active_r: An integer count of the running reader threads for active methods.
         _running_active_w: An integer count of the running writer threads for active methods.
     """
@@ -66,24 +69,18 @@ class NetworkData:
         """Initializes the NetworkData.
         """
         self._nodes = dict()
+        self._buffer = np.empty((_INITIAL_CAPACITY, 3), dtype=np.float64)
+        self._positions = ((), self._read_only(self._buffer[:0]))
         self._is_active = False
 
         # Threading variables
-        self._synch_nodes_r = th.Semaphore()
-        self._synch_nodes_w = th.Semaphore()
         self._mutex_nodes = th.Lock()
 
-        self._blocked_nodes_r = 0
-        self._blocked_nodes_w = 0
-        self._running_nodes_r = 0
-        self._running_nodes_w = 0
+        self._cv_active = th.Condition()
 
-        self._synch_active_r = th.Semaphore()
-        self._synch_active_w = th.Semaphore()
-        self._mutex_active = th.Lock()
-
-        self._blocked_active_r = 0
-        self._blocked_active_w = 0
+        self._waiting_active_r = 0
+        self._waiting_active_w = 0
+        self._admitted_active_r = 0
         self._running_active_r = 0
         self._running_active_w = 0
 
@@ -93,45 +90,27 @@ class NetworkData:
         Args:
             state: A bool indicating the current network state.
         """
-        # Acquires the mutex for the critical section
-        self._mutex_active.acquire()
-
-        # Checks if the thread must be blocked to wait for reader or writer threads.
-        # This check ensures fairness between reader and writer threads avoiding starvation.
-        if self._running_active_r > 0 or self._running_active_w > 0:
-            self._blocked_active_w += 1
-        else:
+        with self._cv_active:
+            # Waits for the running reader and writer threads, and for the reader threads admitted
+            # by the previous writer thread.
+            # This check ensures fairness between reader and writer threads avoiding starvation.
+            self._waiting_active_w += 1
+            while self._running_active_r > 0 or self._running_active_w > 0 or self._admitted_active_r > 0:
+                self._cv_active.wait()
+            self._waiting_active_w -= 1
             self._running_active_w += 1
-            self._synch_active_w.release()
-
-        # Releases the mutex
-        self._mutex_active.release()
-
-        # Blocks the writer thread if the previous conditional statement was True
-        self._synch_active_w.acquire()
 
         # Sets the new state
         self._is_active = state
 
-        # Acquires the mutex for the critical section
-        self._mutex_active.acquire()
-
-        # Decreases the number of running writers
-        self._running_active_w -= 1
+        with self._cv_active:
+            # Decreases the number of running writers
+            self._running_active_w -= 1
 
-        # Checks if multiple reader threads or one writer thread must be unblocked.
-        # This check ensures fairness between reader and writer threads avoiding starvation.
-        if self._blocked_active_r > 0:
-            # Unblocks all reader threads
-            while self._blocked_active_r > 0:
-                self._blocked_active_r -= 1
-                self._synch_active_r.release()
-        elif self._blocked_active_w > 0:
-            self._blocked_active_w -= 1
-            self._synch_active_w.release()
-
-        # Releases the mutex
-        self._mutex_active.release()
+            # Admits all the waiting reader threads before the next writer thread.
+            # This check ensures fairness between reader and writer threads avoiding starvation.
+            self._admitted_active_r = self._waiting_active_r
+            self._cv_active.notify_all()
 
     def get_is_active(self) -> bool:
         """Gets the current network state.
@@ -139,142 +118,134 @@ class NetworkData:
         Returns:
             True if the distributed network is active; False otherwise.
         """
-        # Acquires the mutex for the critical section
-        self._mutex_active.acquire()
-
-        # Checks if the thread must be blocked to wait for writer threads.
-        # This check ensures fairness between reader and writer threads avoiding starvation.
-        if self._running_active_w > 0 or self._blocked_active_w > 0:
-            self._blocked_active_r += 1
-        else:
+        with self._cv_active:
+            # Waits for the running writer thread, and for the waiting ones unless admitted.
+            # This check ensures fairness between reader and writer threads avoiding starvation.
+            self._waiting_active_r += 1
+            while self._running_active_w > 0 or (self._waiting_active_w > 0 and self._admitted_active_r == 0):
+                self._cv_active.wait()
+            self._waiting_active_r -= 1
+            if self._admitted_active_r > 0:
+                self._admitted_active_r -= 1
             self._running_active_r += 1
-            self._synch_active_r.release()
-
-        # Releases the mutex
-        self._mutex_active.release()
-
-        # Blocks the reader thread if the previous conditional statement was True
-        self._synch_active_r.acquire()
 
         # Reads the flag
         is_active = self._is_active
 
-        # Acquires the mutex for the critical section
-        self._mutex_active.acquire()
-
-        # Decreases the number of running readers
-        self._running_active_r -= 1
-
-        # Checks if a writer thread must be unblocked.
-        # This check ensures fairness between reader and writer threads avoiding starvation.
-        if self._blocked_active_w > 0 and self._running_active_r == 0:
-            self._blocked_active_w -= 1
-            self._running_active_w += 1
-            self._synch_active_w.release()
+        with self._cv_active:
+            # Decreases the number of running readers
+            self._running_active_r -= 1
 
-        # Releases the mutex
-        self._mutex_active.release()
+            # Wakes up the waiting writer threads when the last reader thread terminates
+            if self._running_active_r == 0 and self._waiting_active_w > 0:
+                self._cv_active.notify_all()
 
         return is_active
 
     def get_nodes_info(self) -> dict:
         """Gets the nodes information that are present in the distributed network.
 
+        The nodes are stored as a copy-on-write snapshot, so the reader threads never wait:
+        the returned dict is the current snapshot and must not be modified.
+
         Returns:
             A dict containing node IDs as keys and tuples with node position
-            (numpy array) and address (string) as values.
+            (read-only numpy array) and address (string) as values.
         """
-        # Acquires the mutex for the critical section
-        self._mutex_nodes.acquire()
+        # Reads the snapshot, the attribute read is atomic
+        return self._nodes
+
+    def get_positions_matrix(self) -> tuple:
+        """Gets the positions of the nodes that are present in the distributed network.
 
-        # Checks if the thread must be blocked to wait for writer threads.
-        # This check ensures fairness between reader and writer threads avoiding starvation.
-        if self._running_nodes_w > 0 or self._blocked_nodes_w > 0:
-            self._blocked_nodes_r += 1
-        else:
-            self._running_nodes_r += 1
-            self._synch_nodes_r.release()
+        The positions are stored as a single contiguous matrix, so they can be consumed by the
+        estimator without gathering the positions of each node.
 
-        # Releases the mutex
-        self._mutex_nodes.release()
+        Returns:
+            A tuple containing the node IDs and a read-only Nx3 numpy matrix, where
+            the row i is the position [x, y, z] of the i-th node ID.
+        """
+        # Reads the snapshot, the attribute read is atomic
+        return self._positions
 
-        # Blocks the reader thread if the previous conditional statement was True
-        self._synch_nodes_r.acquire()
+    def add_node(self, node_id: int, node_pos, node_address: str) -> bool:
+        """Adds a nodes to the distributed network.
 
-        # Reads the target position
-        nodes_info = copy.deepcopy(self._nodes)
+        The node is added to a copy of the current snapshot, then the snapshot is replaced.
 
-        # Acquires the mutex for the critical section
-        self._mutex_nodes.acquire()
+        Args:
+            node_id: The ID related to the node.
+            node_pos: A 3D numpy array or sequence containing the sensor position [x, y, z].
+                It is copied into the positions buffer.
+            node_address: The ZeroMQ socket address for internode communication.
 
-        # Decreases the number of running readers
-        self._running_nodes_r -= 1
+        Returns:
+            True if the node is added to the distributed network; False otherwise.
+        """
+        return self.add_nodes(nodes=[(node_id, node_pos, node_address)])[0]
 
-        # Checks if a writer thread must be unblocked.
-        # This check ensures fairness between reader and writer threads avoiding starvation.
-        if self._blocked_nodes_w > 0 and self._running_nodes_r == 0:
-            self._blocked_nodes_w -= 1
-            self._running_nodes_w += 1
-            self._synch_nodes_w.release()
+    def add_nodes(self, nodes: list) -> list:
+        """Adds a batch of nodes to the distributed network.
 
-        # Releases the mutex
-        self._mutex_nodes.release()
+        The writer mutex is acquired once for the whole batch, and the snapshots are
+        copied and replaced once, regardless of the number of nodes. The positions are
+        written in place in the preallocated buffer, so no matrix is rebuilt.
 
-        return nodes_info
+        Args:
+            nodes: A list of tuples (node_id, node_pos, node_address), with the same meaning
+                of the add_node arguments.
 
-    def add_node(self, node_id: int, node_pos: np.array, node_address: str) -> bool:
-        """Adds a nodes to the distributed network.
+        Returns:
+            A list of bools, in the order of the nodes, where each value is True if the
+            related node is added to the distributed network; False otherwise.
+        """
+        added = []
+
+        with self._mutex_nodes:
+            nodes_info = self._nodes.copy()
+            node_ids, _ = self._positions
+            new_ids = []
+            count = len(node_ids)
+
+            for node_id, node_pos, node_address in nodes:
+                # Checks if the node is already present, also among the previous nodes of the batch
+                if node_id in nodes_info:
+                    added.append(False)
+                    continue
+
+                # Doubles the buffer when full, the rows already published stay valid in the old one
+                if count == len(self._buffer):
+                    buffer = np.empty((2 * len(self._buffer), 3), dtype=np.float64)
+                    buffer[:count] = self._buffer[:count]
+                    self._buffer = buffer
+
+                # Writes the position in the first free row, the row is shared with the readers as read-only view
+                self._buffer[count] = node_pos
+                nodes_info[node_id] = (self._read_only(self._buffer[count]), node_address)
+                new_ids.append(node_id)
+                added.append(True)
+                count += 1
+
+            # Edge case
+            # Leaves the snapshots untouched when no node is added
+            if not new_ids:
+                return added
+
+            # Replaces the snapshots, the attribute writes are atomic
+            self._nodes = nodes_info
+            self._positions = (node_ids + tuple(new_ids), self._read_only(self._buffer[:count]))
+
+        return added
+
+    @staticmethod
+    def _read_only(view: np.ndarray) -> np.ndarray:
+        """Marks a numpy view as read-only.
 
         Args:
-            node_id: The ID related to the node.
-            node_pos: A 3D numpy array containing the sensor position [x, y, z].
-            node_address: The ZeroMQ socket address for internode communication.
+            view: A numpy view of the positions buffer.
 
         Returns:
-            True if the node is added to the distributed network; False otherwise.
+            The same view, that cannot be used to modify the buffer.
         """
-        # Acquires the mutex for the critical section
-        self._mutex_nodes.acquire()
-
-        # Checks if the thread must be blocked to wait for reader or writer threads.
-        # This check ensures fairness between reader and writer threads avoiding starvation.
-        if self._running_nodes_r > 0 or self._running_nodes_w > 0:
-            self._blocked_nodes_w += 1
-        else:
-            self._running_nodes_w += 1
-            self._synch_nodes_w.release()
-
-        # Releases the mutex
-        self._mutex_nodes.release()
-
-        # Blocks the writer thread if the previous conditional statement was True
-        self._synch_nodes_w.acquire()
-
-        # Adds the new node
-        if node_id not in self._nodes:
-            self._nodes[node_id] = (node_pos, node_address)
-            ret = True
-        else:
-            ret = False
-
-        # Acquires the mutex for the critical section
-        self._mutex_nodes.acquire()
-
-        # Decreases the number of running writers
-        self._running_nodes_w -= 1
-
-        # Checks if multiple reader threads or one writer thread must be unblocked.
-        # This check ensures fairness between reader and writer threads avoiding starvation.
-        if self._blocked_nodes_r > 0:
-            # Unblocks all reader threads
-            while self._blocked_nodes_r > 0:
-                self._blocked_nodes_r -= 1
-                self._synch_nodes_r.release()
-        elif self._blocked_nodes_w > 0:
-            self._blocked_nodes_w -= 1
-            self._synch_nodes_w.release()
-
-        # Releases the mutex
-        self._mutex_nodes.release()
-
-        return ret
+        view.setflags(write=False)
+        return view
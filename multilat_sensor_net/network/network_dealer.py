@@ -1,7 +1,7 @@
 """
 This module implements the NetworkDealer class.
 
-The NetworkDealer class manages communication with nodes in the distributed network using ZeroMQ.
+The NetworkDealer class manages communication with nodes in the distributed network using ZeroMQ on asyncio.
 It acts as a DEALER socket to send requests and receive responses from nodes,
 allowing it to collect distance measurements asynchronously.
 
@@ -11,6 +11,7 @@ Classes:
 Usage Example:
     from multilat_sensor_net.network import NetworkDealer
     import numpy as np
+    import asyncio
 
     nodes_info = {
         1: (np.array([0., 0., 0.]), "tcp://localhost:5551"),
@@ -20,45 +21,117 @@ Usage Example:
     obj = NetworkDealer(verbose=False)
     obj.connect(nodes_info=nodes_info)
 
-    distances = obj.request_distances() # Output: {1: 2.5, 2: 3.1}
+    distances = asyncio.run(obj.request_distances()) # Output: array([2.5, 3.1])
 """
 
+import zmq.asyncio
+import itertools
+import asyncio
+import math
+import numpy as np
+import struct
 import zmq
 
 
+# One-byte opcode of the GetDistance request
+_GET_DISTANCE = 0x01
+
+# Binary layout of the request frame, the opcode followed by the round sequence number as little-endian uint32
+_REQUEST = struct.Struct("<BI")
+
+# Binary layout of the reply frame, the sequence number of the request and the node ID as little-endian uint32,
+# followed by distance as little-endian double
+_REPLY = struct.Struct("<IId")
+
+# The sequence numbers wrap around at the uint32 range
+_SEQ_MASK = 0xFFFFFFFF
+
+
 class NetworkDealer:
     """NetworkDealer class for managing the communication with distributed nodes via ZeroMQ.
 
     This class handles communication with nodes in a distributed network using ZeroMQ DEALER socket.
     It connects to nodes, sends requests for distances, and aggregates responses asynchronously.
+    The sockets are driven by the asyncio event loop, so waiting for the replies does not block
+    the other coroutines of the loop.
+
+    The class keeps a pool of DEALER sockets, each one connected to all the nodes. The requests
+    are assigned to the sockets in round-robin, so that concurrent requests use independent
+    connections instead of waiting for each other.
 
     Attributes:
         n_nodes: An integer indicating the number of nodes in the distributed network.
+        n_sockets: An integer indicating the number of DEALER sockets in the pool.
         verbose: A boolean flag that enables logging for debugging purposes. If True, detailed
             logs about actions performed by the components will be printed to the console.
-        _socket: A ZeroMQ DEALER socket used for requesting messages.
+        _sockets: A list of ZeroMQ asyncio DEALER sockets used for requesting messages.
+        _pollers: A list of ZeroMQ asyncio pollers, each one registered on the related DEALER
+            socket for incoming replies.
+        _locks: A list of asyncio locks, each one serializes the requests on the related socket,
+            so that the replies of concurrent requests on the same socket are not mixed.
+        _rr: An iterator cycling over the socket indices for the round-robin selection.
+        _seq: An integer containing the sequence number of the last round, the replies of
+            the other rounds are discarded.
+        _rows: A dict mapping the node IDs to the related rows of the distances arrays,
+            the rows follow the order of the nodes in the distributed network.
+        _dist_bufs: A list of N numpy arrays, each one is the distances buffer of the related socket,
+            it is overwritten by every request on the socket.
     """
 
-    def __init__(self, verbose: bool) -> None:
+    def __init__(self, verbose: bool, n_sockets: int = 4) -> None:
         """Initializes the NetworkDealer.
 
         Args:
             verbose: Flag indicating whether the classes must produce an output.
+            n_sockets: The number of DEALER sockets in the pool.
         """
         # Dealer attributes
         self.n_nodes = 0
+        self.n_sockets = n_sockets
 
         # Logging attributes
         self.verbose = verbose
 
         # ZeroMQ attributes
-        self._socket = zmq.Context().socket(zmq.DEALER)
+        # The process-wide context is shared, so its IO thread is not created for every dealer
+        context = zmq.asyncio.Context.instance()
+        self._sockets = [context.socket(zmq.DEALER) for _ in range(self.n_sockets)]
+
+        for idx, socket in enumerate(self._sockets):
+            # Pending messages are discarded when a socket is closed, so the shutdown never hangs
+            socket.setsockopt(zmq.LINGER, 0)
+
+            # A fixed identity per socket, the node routers do not need to generate one
+            socket.setsockopt(zmq.IDENTITY, b"network-dealer-%d" % idx)
+
+            # The TCP keepalive detects the connections to nodes that are no longer reachable.
+            # The requests are queued also on the connections that are not completed yet, so the first
+            # round after connect() reaches the nodes once their connections are established.
+            socket.setsockopt(zmq.TCP_KEEPALIVE, 1)
+
+        # The pollers are created once and reused for every request
+        self._pollers = []
+        for socket in self._sockets:
+            poller = zmq.asyncio.Poller()
+            poller.register(socket, zmq.POLLIN)
+            self._pollers.append(poller)
+
+        # Synchronization attributes
+        self._locks = [asyncio.Lock() for _ in range(self.n_sockets)]
+        self._rr = itertools.cycle(range(self.n_sockets))
+        self._seq = 0
+
+        # Distances attributes, they are sized when the nodes are connected
+        self._rows = {}
+        self._dist_bufs = [np.empty(0, dtype=np.float64) for _ in range(self.n_sockets)]
 
     def connect(self, nodes_info: dict) -> None:
         """Connects to the nodes in the distributed network.
 
         This method establishes ZeroMQ connections to the routers of each node
         in the distributed network based on the provided node information.
+        The distances are returned in the order of the nodes in the dict, which is
+        the order of the rows of the NetworkData positions matrix.
 
         Args:
             nodes_info: A dictionary containing node IDs as keys and tuples as values.
@@ -69,65 +142,151 @@ class NetworkDealer:
         # Stores the number of nodes in the distributed network
         self.n_nodes = len(nodes_info)
 
+        # Maps each node to its row, and preallocates the distances buffers
+        self._rows = {node_id: row for row, node_id in enumerate(nodes_info)}
+        self._dist_bufs = [np.empty(self.n_nodes, dtype=np.float64) for _ in range(self.n_sockets)]
+
+        # Bounds the queues, at most one request per node is pending in each round.
+        # The high-water marks only apply to the following connections, so they are set before connecting.
+        for socket in self._sockets:
+            socket.setsockopt(zmq.SNDHWM, 2)
+            socket.setsockopt(zmq.RCVHWM, max(1, self.n_nodes * 2))
+
         for node_data in nodes_info.values():
             # Creates the bind address
             bind_address = node_data[1].replace("*", "localhost")
 
-            # Connects to the nodes routers
-            self._socket.connect(bind_address)
+            # Connects the sockets of the pool to the nodes routers
+            for socket in self._sockets:
+                socket.connect(bind_address)
             print(f"NetworkDealer: Connected to node on {bind_address}")
 
-    def request_distances(self) -> dict:
+    async def request_distances(self, timeout: float = 5.) -> np.ndarray:
         """Requests and collects distance measurements from nodes in the distributed network.
 
         This method sends requests to all nodes in the network, asking for their distance measurements.
-        It asynchronously collects responses using ZeroMQ polling and returns the results
-        as a dictionary mapping node IDs to distances.
+        It asynchronously collects responses using ZeroMQ polling, each wake-up of the poller
+        reads all the replies already available, and returns the results
+        as an array of distances, aligned to the order of the nodes. Each reply is a single binary frame,
+        the sequence number of the round and the node ID (uint32) followed by the distance (double),
+        so no string parsing is required. The late replies of the previous rounds have a different
+        sequence number, so they are discarded and never taken for a reply of the current round.
 
-        Returns:
-            A dict where keys are node IDs (int) and values are distances (float).
-        """
-        # {node_id: distance}
-        distances = {}
+        The whole round is bounded by a single deadline, which covers the wait for the socket,
+        the sends, and the replies. The nodes that do not reply in time have a NaN distance in the result.
 
-        # Sends a request to each node
-        for _ in range(self.n_nodes):
-            # Creates the message to send
-            message = "GetDistance"
-            self._socket.send_string(message)
+        Args:
+            timeout: The maximum time [s] for collecting the replies of all the nodes.
 
-            if self.verbose:
-                print(f"NetworkDealer: Sending request {message}")
+        Returns:
+            A N numpy array where the element i is the distance [m] measured by the i-th node.
+            The array is the buffer of the socket used by the request, it is overwritten by the
+            next requests, so it must be consumed before awaiting again. If the socket is not
+            released by the other requests before the deadline, a new array of NaN is returned.
+        """
+        rows = self._rows
 
-        # Uses a ZeroMQ poller to receive messages asynchronously
-        poller = zmq.Poller()
-        poller.register(self._socket, zmq.POLLIN)
+        # The verbose flag is read once, the loops only evaluate the local
+        verbose = self.verbose
 
         replies_needed = self.n_nodes
         replies_collected = 0
 
-        # Loop for retrieving asynchronously the distances
-        while replies_collected < replies_needed:
-            events = dict(poller.poll(timeout=5000))  # Wait up to 5s for a reply
-            if self._socket in events and events[self._socket] == zmq.POLLIN:
-                # Reads the "node_id:distance" reply from the node
-                reply = self._socket.recv_string()
-
-                # Parses the message
-                node_id_str, dist_str = reply.split(":")
-                node_id = int(node_id_str)
-                distance = float(dist_str)
-
-                # Stores the distance in the dictionary
-                distances[node_id] = distance
-
-                replies_collected += 1
-                if self.verbose:
-                    print(f"NetworkDealer: Received reply from Node[{node_id_str}]: {distance:.2f}m")
-            elif self.verbose:
-                print("NetworkDealer: No reply yet, still waiting")
-
-        if self.verbose:
-            print("NetworkDealer: All responses collected")
+        # Selects the next socket of the pool
+        idx = next(self._rr)
+        socket = self._sockets[idx]
+        poller = self._pollers[idx]
+        distances = self._dist_bufs[idx]
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        # The socket can be shared by concurrent requests, so one request at a time is served.
+        # The wait for the socket is part of the round, so it is bounded by the same deadline.
+        lock = self._locks[idx]
+        try:
+            await asyncio.wait_for(lock.acquire(), timeout=timeout)
+        except asyncio.TimeoutError:
+            if verbose:
+                print(f"NetworkDealer: Deadline expired while waiting for the socket")
+            return np.full(self.n_nodes, np.nan)
+
+        try:
+            # Numbers the round, the request carries the sequence number and each reply echoes it
+            seq = self._seq = (self._seq + 1) & _SEQ_MASK
+            request = _REQUEST.pack(_GET_DISTANCE, seq)
+
+            # The nodes without a reply keep the NaN distance
+            distances.fill(np.nan)
+
+            # Sends a request to each node.
+            # The DEALER socket distributes the messages to the connected nodes in round-robin.
+            # The send does not wait, when the queues of the nodes are full the request has no reply.
+            for _ in range(self.n_nodes):
+                try:
+                    await socket.send(request, zmq.DONTWAIT)
+                except zmq.Again:
+                    replies_needed -= 1
+                    if verbose:
+                        print(f"NetworkDealer: Cannot send request GetDistance, the queues are full")
+                    continue
+                if verbose:
+                    print(f"NetworkDealer: Sending request GetDistance")
+
+            # Loop for retrieving asynchronously the distances
+            while replies_collected < replies_needed:
+                # Stops waiting when the deadline of the round is expired
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+
+                # Only the socket is registered for POLLIN, so any event is a reply on the socket
+                events = await poller.poll(timeout=remaining * 1000)
+                if not events:
+                    if verbose:
+                        print("NetworkDealer: No reply yet, still waiting")
+                    continue
+
+                # Drains all the replies already received without polling again
+                while replies_collected < replies_needed:
+                    try:
+                        # Reads the seq|node_id|distance binary reply from the node
+                        reply = await socket.recv(zmq.DONTWAIT)
+                    except zmq.Again:
+                        break
+
+                    # Edge case
+                    # Checks if the node replied with an error
+                    if len(reply) != _REPLY.size:
+                        if verbose:
+                            print(f"NetworkDealer: Received an error reply")
+                        continue
+
+                    reply_seq, node_id, distance = _REPLY.unpack(reply)
+
+                    # Edge case
+                    # Discards the late replies of the expired rounds
+                    if reply_seq != seq:
+                        if verbose:
+                            print(f"NetworkDealer: Discarded a late reply from Node[{node_id}]")
+                        continue
+
+                    # Stores the distance in the row of the node, each node is counted once
+                    # even if the round-robin sent it more than one request
+                    row = rows[node_id]
+                    if math.isnan(distances[row]):
+                        replies_collected += 1
+                    distances[row] = distance
+
+                    if verbose:
+                        print(f"NetworkDealer: Received reply from Node[{node_id}]: {distance:.2f}m")
+
+            if verbose:
+                if replies_collected < self.n_nodes:
+                    print(f"NetworkDealer: {self.n_nodes - replies_collected} replies missing")
+                else:
+                    print("NetworkDealer: All responses collected")
+        finally:
+            lock.release()
 
         return distances
@@ -14,6 +14,7 @@ Usage Example:
     from multilat_sensor_net.target import TargetService, TargetData
     from multilat_sensor_net.estimator import Multilateration
     import numpy as np
+    import asyncio
 
     obj = NetworkData()
     dealer = NetworkDealer(verbose=False)
@@ -25,17 +26,45 @@ Usage Example:
         socket_addr="localhost:50052",
         verbose=False
     )
-    service.serve()
+    asyncio.run(service.serve())
 
     # After some time in the terminal press CTRL + C to terminate process
 """
 
 from multilat_sensor_net.generated import network_pb2_grpc, network_pb2
-from concurrent import futures
 import numpy as np
+import asyncio
 import signal
 import grpc
-import sys
+
+
+# Options of the gRPC server.
+# The server pings the peers to detect dead connections during the streams, and
+# accepts the keepalive pings of the clients, which are sent every 10s.
+# The port is not shared, the network state lives in a single process, so a second
+# server on the same address must fail instead of receiving part of the calls.
+_SERVER_OPTIONS = [
+    ('grpc.so_reuseport', 0),
+    ('grpc.keepalive_time_ms', 10000),
+    ('grpc.keepalive_timeout_ms', 5000),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.http2.min_ping_interval_without_data_ms', 5000),
+]
+
+# Wire format of the target position, three little-endian doubles
+_POS_DTYPE = np.dtype('<f8')
+
+# Minimum number of measured distances that determine the target position
+_MIN_DISTANCES = 3
+
+# Constant response messages, they are built once and returned by every call.
+# gRPC only serializes the returned messages, so they are never modified.
+_NODE_OK = network_pb2.NodeResponse(status=network_pb2.NS_OK)
+_NODE_ERROR = network_pb2.NodeResponse(status=network_pb2.NS_ERROR)
+_TARGET_ERROR = network_pb2.TargetResponse(
+    status=network_pb2.TS_ERROR,
+    pos=np.full(3, np.inf, dtype=_POS_DTYPE).tobytes()
+)
 
 
 class NetworkService(network_pb2_grpc.NetworkServicer):
@@ -45,9 +74,8 @@ class NetworkService(network_pb2_grpc.NetworkServicer):
     It provides methods for serving client and nodes requests to various function
     and manages the gRPC server lifecycle.
 
-    The gRPC server manages a pool of worker threads. Each incoming request is assigned
-    to one of these threads for processing. If multiple requests arrive simultaneously,
-    the server can process them in parallel, as long as there are available threads in the pool.
+    The gRPC server runs on an asyncio event loop. Each incoming request is served by a coroutine,
+    so multiple requests share the same thread and overlap while they wait for the nodes replies.
 
     Attributes:
         data_ref: A NetworkData instance for managing the state and nodes of the distributed network.
@@ -57,11 +85,20 @@ class NetworkService(network_pb2_grpc.NetworkServicer):
             using multilateration algorithms.
         socket_addr: A string containing the socket address (e.g., "localhost:50052") where the gRPC server will
             listen for incoming connections.
+        compression: A grpc.Compression indicating the compression algorithm of the server, or None.
         verbose: A boolean flag that enables logging for debugging purposes. If True, detailed
             logs about actions performed by the components will be printed to the console.
     """
     
-    def __init__(self, data_ref, dealer_ref, estimator_ref, socket_addr: str, verbose: bool) -> None:
+    def __init__(
+            self,
+            data_ref,
+            dealer_ref,
+            estimator_ref,
+            socket_addr: str,
+            verbose: bool,
+            compression: grpc.Compression = None
+    ) -> None:
         """Initializes the NetworkService.
         
         Args:
@@ -70,6 +107,8 @@ class NetworkService(network_pb2_grpc.NetworkServicer):
             estimator_ref: A Multilateration reference for estimating the target position.
             socket_addr: The socket address where the gRPC server will listen.
             verbose: Flag indicating whether the classes must produce an output.
+            compression: The compression algorithm of the gRPC server, e.g. grpc.Compression.Gzip.
+                The messages are small, so by default they are not compressed.
         """
         self.data_ref = data_ref
         self.dealer_ref = dealer_ref
@@ -77,11 +116,12 @@ class NetworkService(network_pb2_grpc.NetworkServicer):
 
         # gRPC attributes
         self.socket_addr = socket_addr
+        self.compression = compression
 
         # Logging attributes
         self.verbose = verbose
 
-    def AddNode(self, request: network_pb2.NodeRequest, context) -> network_pb2.NodeResponse:
+    async def AddNode(self, request: network_pb2.NodeRequest, context) -> network_pb2.NodeResponse:
         """Handles the AddNode gRPC method.
 
         Args:
@@ -94,35 +134,79 @@ class NetworkService(network_pb2_grpc.NetworkServicer):
         if self.verbose:
             print(f"NetworkService: Received AddNode request from Node[{request.node_id}]")
 
-        # Creates the numpy array
-        node_pos = np.array([request.x, request.y, request.z])
-
         # Edge case
         # Checks if the distributed network is already active
         if self.data_ref.get_is_active():
-            res = network_pb2.NodeResponse(status=network_pb2.NS_ERROR)
+            res = _NODE_ERROR
             if self.verbose:
                 print(f"NetworkService: Cannot add Node[{request.node_id}] because the network is already active")
 
             return res
 
         # Adds the node to the distributed network
-        ret = self.data_ref.add_node(node_id=request.node_id, node_pos=node_pos, node_address=request.bind_address)
+        # The position is copied by the domain object into its positions buffer, no intermediate array is built
+        ret = self.data_ref.add_node(
+            node_id=request.node_id,
+            node_pos=(request.x, request.y, request.z),
+            node_address=request.bind_address
+        )
 
         # Checks on result
         if ret:
-            # Creates the response message
-            res = network_pb2.NodeResponse(status=network_pb2.NS_OK)
+            # Uses the constant response message
+            res = _NODE_OK
             if self.verbose:
                 print(f"NetworkService: Node[{request.node_id}] added to the network")
         else:
-            res = network_pb2.NodeResponse(status=network_pb2.NS_ERROR)
+            res = _NODE_ERROR
             if self.verbose:
                 print(f"NetworkService: Node[{request.node_id}] already present in the network")
 
         return res
 
-    def StartNetwork(self, request: network_pb2.StartRequest, context) -> network_pb2.StartResponse:
+    async def AddNodes(self, request: network_pb2.NodesRequest, context) -> network_pb2.NodesResponse:
+        """Handles the AddNodes gRPC method.
+
+        The nodes of the batch are added to the domain object with a single call,
+        so the whole batch costs one round-trip and one snapshot update.
+
+        Args:
+            request: The request message containing the node IDs and the sensor positions.
+            context: The gRPC context for the method call.
+
+        Returns:
+            A response message containing the status of the operation for each node.
+        """
+        if self.verbose:
+            print(f"NetworkService: Received AddNodes request for {len(request.nodes)} nodes")
+
+        # Edge case
+        # Checks if the distributed network is already active
+        if self.data_ref.get_is_active():
+            res = network_pb2.NodesResponse(status=[network_pb2.NS_ERROR] * len(request.nodes))
+            if self.verbose:
+                print(f"NetworkService: Cannot add the nodes because the network is already active")
+
+            return res
+
+        # Adds the nodes to the distributed network
+        ret = self.data_ref.add_nodes(nodes=[
+            (node.node_id, (node.x, node.y, node.z), node.bind_address) for node in request.nodes
+        ])
+
+        # Creates the response message
+        res = network_pb2.NodesResponse(status=[network_pb2.NS_OK if added else network_pb2.NS_ERROR for added in ret])
+
+        if self.verbose:
+            for node, added in zip(request.nodes, ret):
+                if added:
+                    print(f"NetworkService: Node[{node.node_id}] added to the network")
+                else:
+                    print(f"NetworkService: Node[{node.node_id}] already present in the network")
+
+        return res
+
+    async def StartNetwork(self, request: network_pb2.StartRequest, context) -> network_pb2.StartResponse:
         """Handles the StartNetwork gRPC method.
 
         Args:
@@ -152,8 +236,11 @@ class NetworkService(network_pb2_grpc.NetworkServicer):
         # Connects the dealer to the bind addresses
         self.dealer_ref.connect(nodes_info=nodes_info)
 
-        # Sets the sensor position in the estimator
-        self.estimator_ref.set_sensor_positions(nodes_info=nodes_info)
+        # Sets the sensor position in the estimator from the positions matrix of the domain object.
+        # The handlers run on the event loop, so no node is added between the two snapshot reads and
+        # the rows of the matrix follow the order of the nodes connected by the dealer.
+        node_ids, positions = self.data_ref.get_positions_matrix()
+        self.estimator_ref.set_sensor_matrix(sensor_ids=node_ids, sensor_xyz=positions)
 
         # Sets the network state to active
         self.data_ref.set_is_active(state=True)
@@ -166,59 +253,101 @@ class NetworkService(network_pb2_grpc.NetworkServicer):
 
         return res
 
-    def GetTargetGlobalPosition(self, request: network_pb2.TargetRequest, context) -> network_pb2.TargetResponse:
+    async def GetTargetGlobalPosition(self, request: network_pb2.TargetRequest, context):
         """Handles the GetTargetGlobalPosition gRPC method.
 
+        The target global position is streamed to the client at the requested frequency,
+        the pacing is performed by the server until the client cancels the stream.
+
         Args:
-            request: The request message containing the requesting client ID.
+            request: The request message containing the requesting client ID and the frequency.
             context: The gRPC context for the method call.
 
-        Returns:
-            A response message containing the status of the operation and the
-            target global position computed by the network.
+        Yields:
+            Response messages containing the status of the operation and the
+            target global position computed by the network. A round with less than
+            3 measured distances yields an error message, and the stream continues.
+
+        Raises:
+            grpc.aio.AbortError: If the requested frequency is not a positive finite number, the call is
+                terminated with the INVALID_ARGUMENT status.
         """
         if self.verbose:
             print(f"NetworkService: Received GetTargetGlobalPosition request from Client[{request.client_id}]")
 
+        # Edge case
+        # The stream is paced by the server, a non positive or infinite frequency would stream without any wait.
+        # The comparison also rejects NaN.
+        if not 0. < request.freq < float('inf'):
+            if self.verbose:
+                print(f"NetworkService: Invalid frequency {request.freq} requested by Client[{request.client_id}]")
+
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "The frequency must be a positive finite number")
+
         # Edge case
         # Checks if the distributed network is not active
         if not self.data_ref.get_is_active():
-            res = network_pb2.TargetResponse(status=network_pb2.TS_ERROR, x=np.inf, y=np.inf, z=np.inf)
+            res = _TARGET_ERROR
             if self.verbose:
                 print(f"NetworkService: Cannot retrieve target global position because the network is not active")
 
-            return res
-
-        # Gets the distances from the sensors related to the nodes in the network
-        distances = self.dealer_ref.request_distances()
-        
-        # Estimates the target position using multilateration
-        target_pos = self.estimator_ref.estimate_position(distances=distances)
-
-        # Creates the response message
-        res = network_pb2.TargetResponse(
-            status=network_pb2.TS_OK,
-            x=target_pos[0],
-            y=target_pos[1],
-            z=target_pos[2]
-        )
-
-        if self.verbose:
-            print(f"NetworkService: Target computed")
-
-        return res
-
-    def serve(self) -> None:
+            yield res
+            return
+
+        # Computes the time interval
+        loop = asyncio.get_running_loop()
+        interval = 1.0 / request.freq
+        next_time = loop.time()
+
+        # Streams until the client cancels the call, the cancellation stops the coroutine
+        while True:
+            # Gets the distances from the sensors related to the nodes in the network
+            distances = await self.dealer_ref.request_distances()
+
+            # Edge case
+            # The position is not determined with less than 3 measurements, e.g. when the nodes are down,
+            # so an error is sent for this round instead of the previous estimate
+            if np.count_nonzero(np.isfinite(distances)) < _MIN_DISTANCES:
+                res = _TARGET_ERROR
+                if self.verbose:
+                    print(f"NetworkService: Cannot compute the target, not enough distances received")
+            else:
+                # Estimates the target position using multilateration, before awaiting again
+                # since the distances array is reused by the next requests of the dealer
+                target_pos = self.estimator_ref.estimate_position(distances=distances)
+
+                # Creates the response message, the position is sent as raw bytes without per-coordinate fields
+                res = network_pb2.TargetResponse(
+                    status=network_pb2.TS_OK,
+                    pos=target_pos.astype(_POS_DTYPE, copy=False).tobytes()
+                )
+
+                if self.verbose:
+                    print(f"NetworkService: Target computed")
+
+            yield res
+
+            # Waits for the next deadline to match the requested frequency,
+            # if the deadline is already expired the schedule is realigned to avoid bursts
+            next_time += interval
+            delay = next_time - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                next_time = loop.time()
+
+    async def serve(self) -> None:
         """Starts the gRPC server.
 
-        This method initializes the gRPC server, binds the NetworkService instance to the server,
+        This method initializes the asyncio gRPC server, binds the NetworkService instance to the server,
         and starts listening for client requests at the specified socket address. The server
         will run indefinitely until terminated.
+
+        SIGINT and SIGTERM are handled by the event loop, so the server is stopped gracefully
+        by the loop itself instead of interrupting the coroutine that is running.
         """
-        # Creates the grpc server
-        # By default the number of threads in the pool is set
-        # to the number of processors (CPU cores) available on the machine
-        server = grpc.server(futures.ThreadPoolExecutor())
+        # Creates the asyncio grpc server
+        server = grpc.aio.server(options=_SERVER_OPTIONS, compression=self.compression)
 
         # Binds the NetworkService instance to the server
         network_pb2_grpc.add_NetworkServicer_to_server(self, server)
@@ -227,18 +356,24 @@ class NetworkService(network_pb2_grpc.NetworkServicer):
         server.add_insecure_port(self.socket_addr)
 
         # Starts the server
-        server.start()
+        await server.start()
 
         print(f"NetworkService: gRPC servicer is running on {self.socket_addr}")
 
-        # Define signal handler
-        def handle_shutdown(signum, frame):
+        # The signal handlers only set the event, the shutdown is performed by this coroutine.
+        # The handlers are not supported on all the platforms, there the keyboard interrupt stops the loop.
+        loop = asyncio.get_running_loop()
+        stop_event = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except NotImplementedError:
+                pass
+
+        try:
+            await stop_event.wait()
+        finally:
+            # The server is stopped when a signal is received or the event loop is interrupted,
+            # the active calls have a grace period of 1s
             print("\nNetworkService: Shutting down target gRPC server...")
-            server.stop(1)
-            sys.exit(0)
-
-        # Register signal handlers
-        signal.signal(signal.SIGINT, handle_shutdown)
-        signal.signal(signal.SIGTERM, handle_shutdown)
-
-        server.wait_for_termination()
+            await server.stop(1)
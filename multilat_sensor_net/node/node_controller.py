@@ -22,7 +22,8 @@ Usage Example:
     obj.start()
 """
 
-from multilat_sensor_net.node import NodeStub, NodeRouter
+from .node_stub import NodeStub
+from .node_router import NodeRouter
 from multilat_sensor_net.sensor import SensorController
 import numpy as np
 
@@ -16,9 +16,22 @@ Usage Example:
     router.start()
 """
 
+import struct
 import zmq
 
 
+# One-byte opcode of the GetDistance request, and the error reply for unknown requests
+_GET_DISTANCE = 0x01
+_ERROR = b"Error"
+
+# Size of the request frame, the opcode followed by the round sequence number as little-endian uint32
+_REQUEST_SIZE = 5
+
+# Binary layout of the reply payload, node ID as little-endian uint32 followed by distance as little-endian double.
+# The payload is preceded by the sequence number of the request, copied from the request frame.
+_REPLY = struct.Struct("<Id")
+
+
 class NodeRouter:
     """NodeRouter manages communication between node and the distributed network using ZeroMQ.
 
@@ -56,7 +69,11 @@ class NodeRouter:
         self.bind_address = bind_address
 
         # ZeroMQ attributes
-        self._socket = zmq.Context().socket(zmq.ROUTER)
+        # The process-wide context is shared, so its IO thread is not created for every router
+        self._socket = zmq.Context.instance().socket(zmq.ROUTER)
+
+        # Pending replies are discarded when the socket is closed, so the shutdown never hangs
+        self._socket.setsockopt(zmq.LINGER, 0)
         self._socket.bind(self.bind_address)
 
         print(f"NodeRouter[{self.node_id}]: Listening on {self.bind_address} for requests...")
@@ -66,35 +83,47 @@ class NodeRouter:
 
         This method continuously listens for incoming messages, processes them based on their content,
         and sends appropriate responses. Messages include requests for sensor distance or unknown commands.
+        A request is a one-byte opcode followed by the sequence number (uint32) of the round, so it is
+        checked on the raw bytes without decoding. A distance is sent back as a single binary frame,
+        the sequence number of the request, the node ID (uint32), and the distance (double), so the
+        distributed network can discard the replies of expired rounds.
         """
+        # Binds the attributes used in the loop to locals
+        socket = self._socket
+        reply = _REPLY.pack
+        node_id = self.node_id
+        get_distance = self.sensor_ref.get_distance
+
+        # The verbose flag is read once, the loop only evaluates the local
+        verbose = self.verbose
+
         try:
             while True:
                 # A ROUTER socket receives frames: [identity, message]
                 # Blocking function
-                frames = self._socket.recv_multipart()
+                frames = socket.recv_multipart()
 
                 # frames[0] is the identity used by DEALER, frames[1] is the actual message
                 identity, request_data = frames[0], frames[1]
-                msg = request_data.decode()
 
-                if self.verbose:
-                    print(f"NodeRouter[{self.node_id}]: Received from distributed network request: {msg}")
+                if verbose:
+                    print(f"NodeRouter[{node_id}]: Received from distributed network request: {request_data!r}")
 
-                if msg == "GetDistance":
+                if len(request_data) == _REQUEST_SIZE and request_data[0] == _GET_DISTANCE:
                     # Reads the measurement from the sensor
-                    distance = self.sensor_ref.get_distance()
+                    distance = get_distance()
 
-                    # Creates the response message and sends it back to the distributed network
-                    reply = f"{self.node_id}:{distance}"
-                    self._socket.send_multipart([identity, reply.encode()])
+                    # Creates the seq|node_id|distance binary response and sends it back to the distributed network,
+                    # the sequence number bytes are copied from the request as they are
+                    socket.send_multipart([identity, request_data[1:] + reply(node_id, distance)])
 
-                    if self.verbose:
-                        print(f"NodeRouter[{self.node_id}]: Sent distance {distance:.2f}m")
+                    if verbose:
+                        print(f"NodeRouter[{node_id}]: Sent distance {distance:.2f}m")
                 else:
                     # Sends back to the distributed network and error message
-                    self._socket.send_multipart([identity, "Error".encode()])
+                    socket.send_multipart([identity, _ERROR])
 
-                    if self.verbose:
-                        print(f"NodeRouter[{self.node_id}]: Unknown request")
+                    if verbose:
+                        print(f"NodeRouter[{node_id}]: Unknown request")
         except KeyboardInterrupt:
             print(f"NodeRouter[{self.node_id}: Node stopped")
@@ -20,10 +20,22 @@ Usage Example:
 """
 
 from multilat_sensor_net.generated import network_pb2, network_pb2_grpc
+from multilat_sensor_net.common import ChannelCache
 import numpy as np
 import grpc
 
 
+# Options of the gRPC channel.
+# The keepalive pings detect a dead connection during the calls, and the channel
+# is shared by all the stubs of the process that use the same address and options.
+_CHANNEL_OPTIONS = (
+    ('grpc.keepalive_time_ms', 10000),
+    ('grpc.keepalive_timeout_ms', 5000),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.use_local_subchannel_pool', 1),
+)
+
+
 class NodeStub:
     """NodeStub class for handling communication between a node and the distributed network via gRPC.
 
@@ -37,8 +49,10 @@ class NodeStub:
             listening for incoming distance requests.
         verbose: A boolean flag that enables logging for debugging purposes. If True, detailed
             logs about actions performed by the components will be printed to the console.
-        _channel: A gRPC channel for communicating with the distributed network service.
+        _channel: A shared gRPC channel, from the process-wide cache, for communicating with the distributed network service.
         _network_stub: A gRPC stub object used to call remote methods on the network service.
+        _request: A NodeRequest message used to add the node to the distributed network.
+            The node ID, position, and address never change, so it is built once.
     """
 
     def __init__(
@@ -71,13 +85,23 @@ class NodeStub:
         self.bind_address = bind_address
 
         # gRPC stub attributes
-        self._channel = grpc.insecure_channel(network_service_addr)
+        # The channel is shared with the other components of the process that use the same address
+        self._channel = ChannelCache.get_channel(network_service_addr, options=_CHANNEL_OPTIONS)
         self._network_stub = network_pb2_grpc.NetworkStub(self._channel)
 
+        # Creates the request message
+        self._request = network_pb2.NodeRequest(
+            node_id=node_id,
+            x=float(pos[0]),
+            y=float(pos[1]),
+            z=float(pos[2]),
+            bind_address=bind_address
+        )
+
     def add_node_to_network(self) -> bool:
         """Adds the node to the distributed network via gRPC.
 
-        Constructs a message with the node's ID, bind address, and position, then sends it
+        Sends the message with the node's ID, bind address, and position, built at initialization,
         to the distributed network's gRPC service using the `AddNode` method. Handles
         any gRPC communication errors and returns the status of the operation.
 
@@ -87,20 +111,11 @@ class NodeStub:
         Raises:
             RuntimeError: If the node fails to register with the distributed network.
         """
-        # Creates a request message
-        request = network_pb2.NodeRequest(
-            node_id=self.node_id,
-            x=self.pos[0],
-            y=self.pos[1],
-            z=self.pos[2],
-            bind_address=self.bind_address
-        )
-
         try:
             # Adds the node to the distributed network using the gRPC function
             # The function call will block execution until it receives a response
             # from the server or encounters an error (like a timeout)
-            response = self._network_stub.AddNode(request)
+            response = self._network_stub.AddNode(self._request)
         except grpc.RpcError as rpc_error:
             # When the gRPC servicer is stopped the measurement thread is stopped
             print(f"NodeStub[{self.node_id}]: Error during gRPC communication with distributed network")
@@ -20,7 +20,8 @@ Usage Example:
     time.sleep(5)
 """
 
-from multilat_sensor_net.sensor import SensorData, SensorUpdater
+from .sensor_data import SensorData
+from .sensor_updater import SensorUpdater
 import numpy as np
 
 
@@ -2,6 +2,9 @@
 
 The SensorData class is used for representing a distance sensor into 3D Euclidean space.
 
+The distance is a single float attribute, and in CPython the store and the load of an attribute
+are atomic under the GIL, so the reader and writer threads access it without a mutex.
+
 Classes:
     SensorData: SensorData class for managing a thread-safe distance sensor in a 3D space.
 
@@ -15,8 +18,7 @@ Usage Example:
     obj.get_distance()  # Output: 4.7
 """
 
-import threading as th
-import numpy as np
+import math
 
 
 class SensorData:
@@ -25,21 +27,18 @@ class SensorData:
     This class represents a distance sensor placed in a 3D Euclidean space. This class provides methods for
     setting and retrieving the current measured distance between the sensor and the target.
 
-    This class is thread-safe and provides methods that allow avoiding starvation and deadlock.
+    This class is thread-safe and lock-free, the distance is replaced by a single atomic attribute store,
+    so the readers never wait for the writer and always read a complete value.
 
     Attributes:
         _distance: A float indicating the Euclidean distance in meters [m] between the sensor and the target.
-        _mutex: A threading mutex used to lock critical sections of the code.
     """
 
     def __init__(self) -> None:
         """Initializes the SensorData.
         """
         # Measured distance
-        self._distance = np.inf
-
-        # Threading variables
-        self._mutex = th.Lock()
+        self._distance = math.inf
 
     def get_distance(self) -> float:
         """Gets the current Euclidean distance between the sensor and the target.
@@ -47,16 +46,8 @@ class SensorData:
         Returns:
             A float indicating the distance in meters [m].
         """
-        # Acquires the mutex for the critical section
-        self._mutex.acquire()
-
-        # Reads the measured distance
-        distance = self._distance
-
-        # Releases the mutex
-        self._mutex.release()
-
-        return distance
+        # Reads the measured distance, the attribute load is atomic
+        return self._distance
 
     def set_distance(self, new_distance: float) -> None:
         """Sets the new measured distance between sensor and target.
@@ -64,11 +55,5 @@ class SensorData:
         Args:
             new_distance: A float indicating the distance in meters [m].
         """
-        # Acquires the mutex for the critical section
-        self._mutex.acquire()
-
-        # Sets the distance
-        self._distance = new_distance
-
-        # Releases the mutex
-        self._mutex.release()
+        # Sets the distance, the attribute store is atomic
+        self._distance = float(new_distance)
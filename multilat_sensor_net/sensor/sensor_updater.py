@@ -29,12 +29,27 @@ Usage Example:
 """
 
 from multilat_sensor_net.generated import target_pb2, target_pb2_grpc
+from multilat_sensor_net.common import ChannelCache
 import threading as th
 import numpy as np
-import time
+import random
+import math
 import grpc
 
 
+# Options of the gRPC channel.
+# The messages are a few bytes of uncompressed doubles, so compression and retries are disabled
+# and the message size is bounded. The keepalive pings detect a dead target during the stream.
+_CHANNEL_OPTIONS = (
+    ('grpc.default_compression_algorithm', grpc.Compression.NoCompression.value),
+    ('grpc.enable_retries', 0),
+    ('grpc.keepalive_time_ms', 60000),
+    ('grpc.http2.min_time_between_pings_ms', 60000),
+    ('grpc.max_send_message_length', 64),
+    ('grpc.max_receive_message_length', 64),
+)
+
+
 class SensorUpdater:
     """SensorUpdater class for measuring the Euclidean distance to the target.
 
@@ -52,7 +67,10 @@ class SensorUpdater:
             to the distance measurement.
         verbose: A boolean flag that enables logging for debugging purposes. If True, detailed
             logs about actions performed by the components will be printed to the console.
-        _channel: A gRPC channel for communicating with the target service.
+        _px: A float indicating the x coordinate of the sensor position.
+        _py: A float indicating the y coordinate of the sensor position.
+        _pz: A float indicating the z coordinate of the sensor position.
+        _channel: A shared gRPC channel, from the process-wide cache, for communicating with the target service.
         _target_stub: A gRPC stub object used to call remote methods on the target service.
         _thread: A threading daemon thread that continuously retrieves the target position and
             updates the sensor's distance measurement.
@@ -88,8 +106,12 @@ class SensorUpdater:
         self.acc = acc
         self.freq = freq
 
+        # The coordinates are stored as Python floats, so the distance is computed with scalar arithmetic
+        self._px, self._py, self._pz = float(pos[0]), float(pos[1]), float(pos[2])
+
         # gRPC stub attributes
-        self._channel = grpc.insecure_channel(service_addr)
+        # The channel is shared with the other components of the process that use the same address
+        self._channel = ChannelCache.get_channel(service_addr, options=_CHANNEL_OPTIONS)
         self._target_stub = target_pb2_grpc.TargetStub(self._channel)
 
         # Logging attributes
@@ -100,71 +122,62 @@ class SensorUpdater:
         # avoiding the requirement of a stop function and signal.
         self._thread = th.Thread(target=self._run, daemon=True)
 
-    def _compute_distance(self, target_pos: np.array) -> float:
+    def _compute_distance(self, tx: float, ty: float, tz: float) -> float:
         """Computes the distance between the sensor and the target.
 
         This method calculates the Euclidean distance between the sensor's position and
-        the given target position, then adds Gaussian noise based on the specified variance.
+        the given target position, then adds random Uniform noise based on the specified accuracy.
+        The vectors have 3 components, so scalar arithmetic is faster than numpy operations.
 
         Args:
-            target_pos: A 3D numpy array containing the target position.
+            tx: The x coordinate of the target position.
+            ty: The y coordinate of the target position.
+            tz: The z coordinate of the target position.
 
         Returns:
             A float representing the noisy distance measurement.
         """
         # Computes the Euclidean distance between the sensor position and the target position
-        distance = np.linalg.norm(self.pos - target_pos)
+        dx = self._px - tx
+        dy = self._py - ty
+        dz = self._pz - tz
+        distance = math.sqrt(dx * dx + dy * dy + dz * dz)
 
-        # Adds gaussian noise to the distance (mean: 0, std: sqrt(var))
-        distance += np.random.uniform(low=-self.acc, high=self.acc)
-
-        return distance
+        # Adds random Uniform noise to the distance in the range [-acc, acc]
+        return distance + random.uniform(-self.acc, self.acc)
 
     def _run(self) -> None:
         """Thread body function that continuously measures the distance to the target.
 
-         This method runs in a separate daemon thread. It performs these steps in a loop:
-             1. Requests the target's position via gRPC.
-             2. Computes the distance with added random Uniform noise.
-             3. Updates the sensor's domain object with the measured distance.
-             4. Waits the appropriate interval to maintain the specified measurement frequency.
+         This method runs in a separate daemon thread. It opens a stream of target positions,
+         paced by the target service at the specified measurement frequency, and for each position:
+             1. Computes the distance with added random Uniform noise.
+             2. Updates the sensor's domain object with the measured distance.
 
          The loop continues until either the main thread exits (daemon thread behavior) or
          a gRPC error occurs, in which case the loop stops.
          """
-        # Computes the time interval
-        interval = 1.0 / self.freq
-
         print(f"SensorUpdater[{self.node_id}]: Starting at {self.freq} Hz")
 
-        # Measurement loop
-        while True:
-            start_time = time.time()
-
-            # Creates a request message
-            request = target_pb2.GetPositionRequest(node_id=self.node_id)
-
-            try:
-                # Gets the target position using the gRPC function
-                # The function call will block execution until it receives a response
-                # from the server or encounters an error (like a timeout)
-                response = self._target_stub.GetPosition(request)
-            except grpc.RpcError as rpc_error:
-                # When the gRPC servicer is stopped the measurement thread is stopped
-                print(f"SensorUpdater[{self.node_id}]: Error during gRPC communication with target")
-                break
-
-            # Computes the distance
-            dist = self._compute_distance(target_pos=np.array([response.x, response.y, response.z]))
-
-            # Updates the measured distance in the domain object
-            self.data_ref.set_distance(new_distance=dist)
-
-            # Sleeps until next interval to match the specified frequency
-            elapsed = time.time() - start_time
-            sleep_time = interval - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+        # Creates the request message, the stream lasts for the whole life of the thread
+        request = target_pb2.StreamPositionRequest(node_id=self.node_id, freq=self.freq)
+
+        # Binds the attributes used in the loop to locals
+        compute_distance = self._compute_distance
+        set_distance = self.data_ref.set_distance
+
+        try:
+            # Measurement loop, each target position is received from the stream.
+            # A single HTTP/2 stream is used, so no call is started at every measurement.
+            for response in self._target_stub.StreamPosition(request):
+                # Computes the distance
+                dist = compute_distance(response.x, response.y, response.z)
+
+                # Updates the measured distance in the domain object
+                set_distance(new_distance=dist)
+        except grpc.RpcError as rpc_error:
+            # When the gRPC servicer is stopped the measurement thread is stopped
+            print(f"SensorUpdater[{self.node_id}]: Error during gRPC communication with target")
 
         print(f"SensorUpdater[{self.node_id}]: Stopped")
 
@@ -12,6 +12,7 @@ Usage Example:
 
     obj = TargetController(
         socket_addr="localhost:50051",
+        uds_addr="unix:/tmp/multilat_target.sock",
         path_file="./data/path.json",
         freq=3,
         loop_path=True,
@@ -22,8 +23,11 @@ Usage Example:
     # After some time in the terminal press CTRL + C to terminate the process
 """
 
-from multilat_sensor_net.target import TargetData, TargetService, TargetUpdater
+from .target_data import TargetData
+from .target_service import TargetService
+from .target_updater import TargetUpdater
 import numpy as np
+import asyncio
 
 
 class TargetController:
@@ -49,7 +53,12 @@ class TargetController:
             path_file: str,
             freq: float,
             loop_path: bool = False,
-            verbose: bool = False
+            verbose: bool = False,
+            uds_addr: str = None,
+            realtime: bool = False,
+            keyframe_dt: float = None,
+            interp: str = "linear",
+            cpu_id: int = None
     ) -> None:
         """Initializes the TargetController.
 
@@ -61,12 +70,20 @@ class TargetController:
                 Defaults to False.
             verbose: Flag indicating whether the classes must produce an output.
                 Defaults to False.
+            uds_addr: The unix domain socket address where the gRPC server will also listen
+                (e.g., 'unix:/tmp/multilat_target.sock'), for the sensors on the same host. Defaults to None.
+            realtime: Flag indicating whether the position updater thread requests the real-time
+                scheduling class on Linux. Defaults to False.
+            keyframe_dt: The time interval [s] between two waypoints, used as keyframes of an interpolated
+                trajectory. If None, each update moves the target to the next waypoint. Defaults to None.
+            interp: The interpolation between the keyframes, "linear" or "cubic". Defaults to "linear".
+            cpu_id: The CPU where the position updater thread is pinned on Linux. Defaults to None.
         """
         # Domain object
         self.data = TargetData(start_pos=np.array([0., 0., 0.]))
 
         # gRPC service
-        self.service = TargetService(data_ref=self.data, socket_addr=socket_addr, verbose=verbose)
+        self.service = TargetService(data_ref=self.data, socket_addr=socket_addr, verbose=verbose, uds_addr=uds_addr)
 
         # Position updater
         self.updater = TargetUpdater(
@@ -74,7 +91,11 @@ class TargetController:
             path_file=path_file,
             freq=freq,
             loop_path=loop_path,
-            verbose=verbose
+            verbose=verbose,
+            realtime=realtime,
+            keyframe_dt=keyframe_dt,
+            interp=interp,
+            cpu_id=cpu_id
         )
 
     def start(self) -> None:
@@ -82,7 +103,12 @@ class TargetController:
 
         This method initiates the position updater thread and starts the gRPC server,
         enabling the target to begin moving along the predefined trajectory and accept
-        external requests via gRPC.
+        external requests via gRPC. The service runs on an asyncio event loop until a keyboard
+        interrupt is identified.
         """
         self.updater.start()
-        self.service.serve()
+
+        try:
+            asyncio.run(self.service.serve())
+        except KeyboardInterrupt:
+            pass
@@ -12,11 +12,12 @@ Usage Example:
     obj = TargetData(start_pos=np.array([0., 0., 0.]))
     obj.set_position(new_pos=np.array([1., 1., 1.]))
 
-    obj.get_position()  # Output: array([1., 1., 1.])
+    obj.get_position()  # Output: (1.0, 1.0, 1.0)
 """
 
 import threading as th
 import numpy as np
+import time
 
 
 class TargetData:
@@ -25,18 +26,17 @@ class TargetData:
     This class represents a target object that is moving in a 3D Euclidean space. This class provides methods for
     setting and retrieving the current object position.
 
-    This class is thread-safe and provides a balanced way for readers and writers
-    to call the related methods without incurring in starvation and deadlock.
+    This class is thread-safe and the readers are lock-free, the position is protected by a sequence lock.
+    The writer increments the version before and after updating the coordinates, so the version is odd
+    while an update is in progress. A reader reads the version, the coordinates and the version again,
+    and retries if an update was in progress or completed in the meantime.
 
     Attributes:
-        _pos: A 3D numpy array indicating the current target position [x, y, z].
-        _synch_r: A threading semaphore used to handle requests from multiple reader threads.
-        _synch_w: A threading semaphore used to handler requests from multiple writer threads.
-        _mutex: A threading mutex used to lock critical sections of the code.
-        _blocked_r: An integer count of the blocked reader threads.
-        _blocked_w: An integer count of the blocked writer threads.
-        _running_r: An integer count of the running reader threads.
-        _running_w: An integer count of the running writer threads.
+        _x: A float indicating the x coordinate of the current target position.
+        _y: A float indicating the y coordinate of the current target position.
+        _z: A float indicating the z coordinate of the current target position.
+        _version: An integer incremented twice by every update, it is odd while an update is in progress.
+        _mutex_w: A threading mutex used to serialize the writer threads, the readers never acquire it.
     """
 
     def __init__(self, start_pos: np.array) -> None:
@@ -45,62 +45,34 @@ class TargetData:
         Args:
             start_pos: A 3D numpy array containing the starting position of the object.
         """
-        # Position array
-        self._pos = start_pos
+        # Position coordinates
+        self._x, self._y, self._z = float(start_pos[0]), float(start_pos[1]), float(start_pos[2])
 
         # Threading variables
-        self._synch_r = th.Semaphore()
-        self._synch_w = th.Semaphore()
-        self._mutex = th.Lock()
+        self._version = 0
+        self._mutex_w = th.Lock()
 
-        self._blocked_r = 0
-        self._blocked_w = 0
-        self._running_r = 0
-        self._running_w = 0
-
-    def get_position(self) -> np.array:
+    def get_position(self) -> tuple:
         """Gets the current position of the target object.
 
+        The coordinates are returned as plain floats, no numpy array is allocated by the readers.
+
         Returns:
-            A 3D numpy array indicating the current target position [x, y, z].
+            A tuple of floats indicating the current target position (x, y, z).
         """
-        # Acquires the mutex for the critical section
-        self._mutex.acquire()
-
-        # Checks if the thread must be blocked to wait for writer threads.
-        # This check ensures fairness between reader and writer threads avoiding starvation.
-        if self._running_w > 0 or self._blocked_w > 0:
-            self._blocked_r += 1
-        else:
-            self._running_r += 1
-            self._synch_r.release()
-
-        # Releases the mutex
-        self._mutex.release()
-
-        # Blocks the reader thread if the previous conditional statement was True
-        self._synch_r.acquire()
-
-        # Reads the target position
-        pos = self._pos
+        while True:
+            version = self._version
 
-        # Acquires the mutex for the critical section
-        self._mutex.acquire()
+            # Edge case
+            # An update is in progress, the GIL is released so that the writer can complete it
+            if version & 1:
+                time.sleep(0)
+                continue
 
-        # Decreases the number of running readers
-        self._running_r -= 1
-
-        # Checks if a writer thread must be unblocked.
-        # This check ensures fairness between reader and writer threads avoiding starvation.
-        if self._blocked_w > 0 and self._running_r == 0:
-            self._blocked_w -= 1
-            self._running_w += 1
-            self._synch_w.release()
-
-        # Releases the mutex
-        self._mutex.release()
-
-        return pos
+            # Reads the coordinates, they are consistent if the version did not change
+            x, y, z = self._x, self._y, self._z
+            if self._version == version:
+                return x, y, z
 
     def set_position(self, new_pos: np.array) -> None:
         """Sets the current position of the target object.
@@ -108,42 +80,15 @@ class TargetData:
         Args:
             new_pos: A 3D numpy array indicating the current target position [x, y, z].
         """
-        # Acquires the mutex for the critical section
-        self._mutex.acquire()
-
-        # Checks if the thread must be blocked to wait for reader or writer threads.
-        # This check ensures fairness between reader and writer threads avoiding starvation.
-        if self._running_r > 0 or self._running_w > 0:
-            self._blocked_w += 1
-        else:
-            self._running_w += 1
-            self._synch_w.release()
-
-        # Releases the mutex
-        self._mutex.release()
-
-        # Blocks the writer thread if the previous conditional statement was True
-        self._synch_w.acquire()
-
-        # Sets the target position
-        self._pos = new_pos
-
-        # Acquires the mutex for the critical section
-        self._mutex.acquire()
-
-        # Decreases the number of running writers
-        self._running_w -= 1
-
-        # Checks if multiple reader threads or one writer thread must be unblocked.
-        # This check ensures fairness between reader and writer threads avoiding starvation.
-        if self._blocked_r > 0:
-            # Unblocks all reader threads
-            while self._blocked_r > 0:
-                self._blocked_r -= 1
-                self._synch_r.release()
-        elif self._blocked_w > 0:
-            self._blocked_w -= 1
-            self._synch_w.release()
-
-        # Releases the mutex
-        self._mutex.release()
+        # Converts the coordinates before starting the update, to keep the odd version window short
+        x, y, z = float(new_pos[0]), float(new_pos[1]), float(new_pos[2])
+
+        with self._mutex_w:
+            # Marks the update as in progress
+            self._version += 1
+
+            # Sets the target position
+            self._x, self._y, self._z = x, y, z
+
+            # Marks the update as completed
+            self._version += 1
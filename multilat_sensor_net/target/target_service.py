@@ -9,20 +9,32 @@ Classes:
 
 Usage Example:
     import numpy as np
+    import asyncio
     from multilat_sensor_net.target import TargetService, TargetData
 
     obj = TargetData(start_pos=np.array([0., 0., 0.]))
     service = TargetService(data_ref=obj, socket_addr="localhost:50051", verbose=False)
-    service.serve()
+    asyncio.run(service.serve())
 
     # After some time in the terminal press CTRL + C to terminate process
 """
 
 from multilat_sensor_net.generated import target_pb2, target_pb2_grpc
-from concurrent import futures
-import grpc
-import sys
+import asyncio
 import signal
+import grpc
+
+
+# Options of the gRPC server.
+# The messages are a few bytes of uncompressed doubles, so the message size is bounded and
+# the keepalive pings of the sensors, sent every 60s during the streams, are accepted.
+# The port is not shared, the target position lives in a single process.
+_SERVER_OPTIONS = [
+    ('grpc.so_reuseport', 0),
+    ('grpc.max_send_message_length', 64),
+    ('grpc.max_receive_message_length', 64),
+    ('grpc.http2.min_ping_interval_without_data_ms', 30000),
+]
 
 
 class TargetService(target_pb2_grpc.TargetServicer):
@@ -32,34 +44,56 @@ class TargetService(target_pb2_grpc.TargetServicer):
     It provides methods for serving client requests to get the position of a target
     and manages the gRPC server lifecycle.
 
-    The gRPC server manages a pool of worker threads. Each incoming request is assigned
-    to one of these threads for processing. If multiple requests arrive simultaneously,
-    the server can process them in parallel, as long as there are available threads in the pool.
+    The gRPC server runs on an asyncio event loop. Each incoming request is served by a coroutine,
+    so all the sensor streams are multiplexed on the same thread without a worker thread per call.
+    The position is read from a lock-free domain object, so the handlers never block the event loop.
 
     Attributes:
         data_ref: A TargetData reference representing the domain logic for managing
             the target's position in a 3D space.
         socket_addr: A string containing the socket address (e.g., "localhost:50051") where the gRPC server will
             listen for incoming connections.
+        uds_addr: A string containing the unix domain socket address (e.g., "unix:/tmp/multilat_target.sock")
+            where the gRPC server will also listen, or None.
         verbose: A boolean flag that enables logging for debugging purposes. If True, detailed
             logs about actions performed by the components will be printed to the console.
+        _response: A GetPositionResponse message reused by the GetPosition calls, only the coordinates
+            are updated at every call.
+        _stopping: A boolean flag set when the server is shutting down, it ends the active streams.
     """
 
-    def __init__(self, data_ref, socket_addr: str, verbose: bool) -> None:
+    def __init__(self, data_ref, socket_addr: str, verbose: bool, uds_addr: str = None) -> None:
         """Initializes the TargetService.
 
         Args:
             data_ref: A TargetData reference for handling domain logic.
             socket_addr: The socket address where the gRPC server will listen.
             verbose: Flag indicating whether the classes must produce an output.
+            uds_addr: An optional unix domain socket address where the gRPC server will also listen.
+                The sensors running on the same host can connect to it, avoiding the TCP loopback stack.
         """
         self.data_ref = data_ref
         self.socket_addr = socket_addr
+        self.uds_addr = uds_addr
 
         # Logging attributes
         self.verbose = verbose
 
-    def GetPosition(self, request: target_pb2.GetPositionRequest, context) -> target_pb2.GetPositionResponse:
+        # Response message of the GetPosition calls.
+        # The handlers run on the event loop thread and gRPC serializes the returned message before
+        # the next handler is resumed, so a single message can be reused by all the calls.
+        self._response = target_pb2.GetPositionResponse(status=target_pb2.PS_OK)
+
+        # Shutdown attributes
+        self._stopping = False
+
+        # The handler is specialized on the verbose flag, which never changes after the initialization.
+        # The server looks up the handlers when the servicer is added, so the silent variant is
+        # registered and the calls do not check the flag.
+        if not verbose:
+            self.GetPosition = self._get_position_silent
+
+    async def GetPosition(self, request: target_pb2.GetPositionRequest, context) -> target_pb2.GetPositionResponse:
         """Handles the GetPosition gRPC method.
 
         Args:
@@ -73,29 +107,101 @@ class TargetService(target_pb2_grpc.TargetServicer):
             print(f"TargetService: Received GetPosition request from Sensor[{request.node_id}]")
 
         # Retrieves the current target position from the domain object
-        pos = self.data_ref.get_position()
+        x, y, z = self.data_ref.get_position()
 
-        # Creates the response message
-        res = target_pb2.GetPositionResponse(
-            status=target_pb2.PS_OK,
-            x=pos[0],
-            y=pos[1],
-            z=pos[2]
-        )
+        # Updates the coordinates of the reused response message
+        res = self._response
+        res.x, res.y, res.z = x, y, z
 
         return res
 
-    def serve(self) -> None:
+    async def _get_position_silent(
+            self,
+            request: target_pb2.GetPositionRequest,
+            context
+    ) -> target_pb2.GetPositionResponse:
+        """Handles the GetPosition gRPC method without logging.
+
+        Args:
+            request: The request message containing the node ID.
+            context: The gRPC context for the method call.
+
+        Returns:
+            A response message containing the status and the position [x, y, z] of the target.
+        """
+        res = self._response
+        res.x, res.y, res.z = self.data_ref.get_position()
+
+        return res
+
+    async def StreamPosition(self, request: target_pb2.StreamPositionRequest, context):
+        """Handles the StreamPosition gRPC method.
+
+        The target position is streamed to the sensor at the requested frequency, the pacing
+        is performed by the server until the sensor cancels the stream.
+
+        Args:
+            request: The request message containing the node ID and the frequency.
+            context: The gRPC context for the method call.
+
+        Yields:
+            Response messages containing the status and the position [x, y, z] of the target.
+
+        Raises:
+            grpc.aio.AbortError: If the requested frequency is not a positive finite number, the call is
+                terminated with the INVALID_ARGUMENT status.
+        """
+        if self.verbose:
+            print(f"TargetService: Received StreamPosition request from Sensor[{request.node_id}]")
+
+        # Edge case
+        # The stream is paced by the server, a non positive or infinite frequency would stream without any wait
+        # and saturate the event loop shared by all the sensors. The comparison also rejects NaN.
+        if not 0. < request.freq < float('inf'):
+            if self.verbose:
+                print(f"TargetService: Invalid frequency {request.freq} requested by Sensor[{request.node_id}]")
+
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "The frequency must be a positive finite number")
+
+        # Computes the time interval
+        loop = asyncio.get_running_loop()
+        interval = 1.0 / request.freq
+        next_time = loop.time()
+
+        # Creates the response message of the stream, the coordinates are updated at every position.
+        # The generator is resumed after the previous message has been serialized, so it can be reused.
+        res = target_pb2.GetPositionResponse(status=target_pb2.PS_OK)
+
+        # Streams until the sensor cancels the call, the cancellation stops the coroutine.
+        # When the server is shutting down the stream is completed, so it is not cancelled at the end of the grace period.
+        while not self._stopping:
+            # Retrieves the current target position from the domain object
+            res.x, res.y, res.z = self.data_ref.get_position()
+
+            yield res
+
+            # Waits for the next deadline to match the requested frequency,
+            # if the deadline is already expired the schedule is realigned to avoid bursts
+            next_time += interval
+            delay = next_time - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                next_time = loop.time()
+
+    async def serve(self) -> None:
         """Starts the gRPC server.
 
-        This method initializes the gRPC server, binds the TargetService instance to the server,
+        This method initializes the asyncio gRPC server, binds the TargetService instance to the server,
         and starts listening for client requests at the specified socket address. The server
         will run indefinitely until terminated.
+
+        SIGINT and SIGTERM are handled by the event loop, so the server is stopped gracefully
+        by the loop itself instead of interrupting the coroutine that is running.
         """
-        # Creates the grpc server
-        # By default the number of threads in the pool is set
-        # to the number of processors (CPU cores) available on the machine
-        server = grpc.server(futures.ThreadPoolExecutor())
+        # Creates the asyncio grpc server
+        # The handlers are coroutines, so no thread pool is required
+        server = grpc.aio.server(options=_SERVER_OPTIONS, compression=grpc.Compression.NoCompression)
 
         # Binds the TargetService instance to the server
         target_pb2_grpc.add_TargetServicer_to_server(self, server)
@@ -103,20 +209,32 @@ class TargetService(target_pb2_grpc.TargetServicer):
         # Adds an insecure port to listen for requests
         server.add_insecure_port(self.socket_addr)
 
+        # Adds the unix domain socket for the sensors on the same host
+        if self.uds_addr is not None:
+            server.add_insecure_port(self.uds_addr)
+
         # Starts the server
-        server.start()
+        await server.start()
 
         print(f"TargetService: gRPC servicer is running on {self.socket_addr}")
-
-        # Define signal handler
-        def handle_shutdown(signum, frame):
+        if self.uds_addr is not None:
+            print(f"TargetService: gRPC servicer is running on {self.uds_addr}")
+
+        # The signal handlers only set the event, the shutdown is performed by this coroutine.
+        # The handlers are not supported on all the platforms, there the keyboard interrupt stops the loop.
+        loop = asyncio.get_running_loop()
+        stop_event = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except NotImplementedError:
+                pass
+
+        try:
+            await stop_event.wait()
+        finally:
+            # The server is stopped when a signal is received or the event loop is interrupted,
+            # the active calls have a grace period of 1s
             print("\nTargetService: Shutting down gRPC servicer...")
-            server.stop(1)
-            sys.exit(0)
-
-        # Register signal handlers
-        signal.signal(signal.SIGINT, handle_shutdown)
-        signal.signal(signal.SIGTERM, handle_shutdown)
-
-        # Blocks the thread until server termination
-        server.wait_for_termination()
+            self._stopping = True
+            await server.stop(1)
@@ -4,6 +4,17 @@ The TargetUpdater class manages updating a target's position in a 3D space based
 trajectory waypoints loaded from a JSON file. The position updates are performed in a
 separate thread at a specified frequency, with an option to loop the trajectory indefinitely.
 
+By default each update moves the target to the next waypoint. When a keyframe interval is given,
+the waypoints are keyframes placed at that interval and the trajectory is interpolated
+(linear or cubic) at the update frequency, so the JSON file stays small at any frequency.
+
+The parsed waypoints are cached in a .npy file next to the JSON file, so the following
+starts load the binary matrix instead of parsing the JSON file again. The name of the cache
+contains the size and the modification time of the JSON file, so a different version of the file
+never loads the cache of another one.
+Large trajectories can also be stored in a .f64bin file, a raw little-endian float64 (N, 3) matrix
+written by the json2bin.py script, which is memory-mapped without any parsing.
+
 Classes:
     TargetUpdater: TargetService class for managing target position updates in 3D space.
 
@@ -21,8 +32,58 @@ Usage Example:
 
 import numpy as np
 import threading as th
+import itertools
 import time
-import json
+import ctypes
+import glob
+import sys
+import os
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    # orjson is optional, without it the waypoints are parsed by the standard library
+    from json import loads as json_loads
+
+# Schema of the waypoints file, an array of objects with numeric x, y, z coordinates
+_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "required": ["x", "y", "z"],
+        "properties": {
+            "x": {"type": "number"},
+            "y": {"type": "number"},
+            "z": {"type": "number"},
+        },
+    },
+}
+
+try:
+    from jsonschema import Draft7Validator
+
+    # The validator is built once, when the module is imported
+    _VALIDATOR = Draft7Validator(_SCHEMA)
+except ImportError:
+    # jsonschema is optional, without it only the structure of the waypoints is validated
+    _VALIDATOR = None
+
+
+# Linux prctl option that sets the timer slack of the calling thread
+_PR_SET_TIMERSLACK = 29
+
+# Real-time priority of the updater thread on Linux, low enough to not preempt the kernel threads
+_FIFO_PRIORITY = 10
+
+# Final part of each interval [ns] that is busy-waited instead of slept, when the spin is enabled
+_SPIN_NS = 500_000
+
+# Frequency [Hz] from which the spin is enabled by default, at lower rates the oversleep is negligible
+_SPIN_FREQ = 100.
+
+# Suffix and element type of the raw binary waypoints files
+_BIN_SUFFIX = ".f64bin"
+_BIN_DTYPE = np.dtype('<f8')
 
 
 class TargetUpdater:
@@ -36,18 +97,59 @@ class TargetUpdater:
     Attributes:
         data_ref: A TargetData reference representing the domain logic for managing
             the target's position in a 3D space.
-        path_file: A string containing the path to the JSON file that holds the trajectory waypoints.
+        path_file: A string containing the path to the JSON file that holds the trajectory waypoints,
+            or to a .f64bin file that holds the raw waypoints matrix.
         freq: A float indicating the target position updating frequency [Hz].
         loop_path: A bool indicating whether to repeat in loop the trajectory.
-        waypoints: A list containing the trajectory waypoints that the target must follow
-            (e.g. of waypoint, { "x": 5.0000, "y": 2.5000, "z": 1.2 }).
+        waypoints: A (N, 3) contiguous numpy array where each row is a trajectory waypoint [x, y, z]
+            that the target must follow (e.g. of waypoint in the JSON file, { "x": 5.0000, "y": 2.5000, "z": 1.2 }).
+        keyframe_dt: A float indicating the time interval [s] between two waypoints, or None when each
+            update moves the target to the next waypoint.
+        interp: A string indicating the interpolation between the keyframes, "linear" or "cubic".
         verbose: A boolean flag that enables logging for debugging purposes. If True, detailed
             logs about actions performed by the components will be printed to the console.
+        realtime: A boolean flag indicating whether the thread requests the real-time scheduling class on Linux.
+        spin_ns: An integer indicating the final part of each interval [ns] that is busy-waited instead of slept.
+        cpu_id: An integer indicating the CPU where the thread is pinned on Linux, or None.
+        _samples: A (M, 3) contiguous numpy array containing the target position of each update,
+            it is the waypoints matrix when no keyframe interval is given.
+        _waypoint_strs: A list containing the formatted coordinates of each sample for the verbose log,
+            or None when the verbose log is disabled.
         _thread: A threading daemon thread where the target position is updated based
             on the trajectory waypoints at the specified frequency.
     """
 
-    def __init__(self, data_ref, path_file: str, freq: float, loop_path: bool, verbose: bool) -> None:
+    # The attributes are stored in slots instead of an instance dict
+    __slots__ = (
+        "data_ref",
+        "path_file",
+        "freq",
+        "loop_path",
+        "waypoints",
+        "keyframe_dt",
+        "interp",
+        "verbose",
+        "realtime",
+        "spin_ns",
+        "cpu_id",
+        "_samples",
+        "_waypoint_strs",
+        "_thread",
+    )
+
+    def __init__(
+            self,
+            data_ref,
+            path_file: str,
+            freq: float,
+            loop_path: bool,
+            verbose: bool,
+            realtime: bool = False,
+            spin_ns: int = None,
+            keyframe_dt: float = None,
+            interp: str = "linear",
+            cpu_id: int = None
+    ) -> None:
         """Initializes the TargetUpdater.
 
         Args:
@@ -56,9 +158,21 @@ class TargetUpdater:
             freq: The update frequency [Hz] for the thread.
             loop_path: Flag indicating whether to loop the waypoints.
             verbose: Flag indicating whether the classes must produce an output.
+            realtime: Flag indicating whether the thread requests the SCHED_FIFO real-time class on Linux.
+                It reduces the wake-up latency on a loaded machine, but it requires the CAP_SYS_NICE capability.
+            spin_ns: The final part of each interval [ns] that is busy-waited, to remove the oversleep of
+                the timed wait. The thread holds the GIL while spinning, 0 disables the busy-wait.
+                If None, the busy-wait is enabled only when the frequency is at least 100 Hz.
+            keyframe_dt: The time interval [s] between two waypoints, used as keyframes of the trajectory.
+                If None, each update moves the target to the next waypoint.
+            interp: The interpolation between the keyframes, "linear" or "cubic".
+            cpu_id: The CPU where the thread is pinned on Linux, so it is not migrated between CPUs.
+                It is best paired with a CPU isolated from the scheduler (isolcpus kernel parameter).
+                If None, the thread can run on any CPU.
 
         Raises:
             ValueError: If the JSON file doesn't contain any waypoints (it's empty).
+            ValueError: If the keyframe interval is not positive or the interpolation is not supported.
         """
         self.data_ref = data_ref
 
@@ -66,85 +180,363 @@ class TargetUpdater:
         self.path_file = path_file
         self.freq = freq
         self.loop_path = loop_path
+        self.keyframe_dt = keyframe_dt
+        self.interp = interp
 
-        self.waypoints = self._read_waypoints()
-        if not self.waypoints:
-            raise ValueError("TargetUpdater: No waypoints found in the specified JSON file.")
+        # Edge cases
+        if keyframe_dt is not None and not keyframe_dt > 0:
+            raise ValueError(f"TargetUpdater: The keyframe interval must be positive, got {keyframe_dt}")
+        if interp not in ("linear", "cubic"):
+            raise ValueError(f"TargetUpdater: Unsupported interpolation {interp}, must be linear or cubic")
 
         # Logging attributes
         self.verbose = verbose
 
+        # Scheduling attributes
+        self.realtime = realtime
+        # The spin burns CPU on every update, so by default it is reserved to the high frequencies
+        if spin_ns is None:
+            spin_ns = _SPIN_NS if freq >= _SPIN_FREQ else 0
+        self.spin_ns = spin_ns
+        self.cpu_id = cpu_id
+
+        self.waypoints = self._read_waypoints()
+        if self.waypoints.shape[0] == 0:
+            raise ValueError("TargetUpdater: No waypoints found in the specified JSON file.")
+
+        # Computes the target position of each update
+        self._samples = self._resample()
+
+        # The samples never change, so the coordinates of the log are formatted once
+        self._waypoint_strs = [f"{x:.3f};{y:.3f};{z:.3f}" for x, y, z in self._samples.tolist()] if verbose else None
+
         # The daemon thread is used to avoid the necessity of joining it to the main thread.
         # When the main thread finished its work, the daemon thread will be automatically stopped,
         # avoiding the requirement of a stop function and signal.
         self._thread = th.Thread(target=self._run, daemon=True)
 
-    def _read_waypoints(self) -> list:
-        """Reads the waypoints from the specified JSON file.
+    def _read_waypoints(self) -> np.ndarray:
+        """Reads the waypoints from the specified JSON or .f64bin file.
 
         Returns:
-            The list of waypoints extracted from the JSON file.
+            A (N, 3) numpy array containing the waypoints extracted from the file, one per row.
 
         Raises:
             ValueError: If a waypoint doesn't contain X, Y, Z coordinates.
             ValueError: If the waypoint format is different from the specified standard.
+            ValueError: If a coordinate of the file is not a finite number.
+            ValueError: If the size of the .f64bin file is not a multiple of a waypoint size.
         """
-        # Reads the data from the JSON file
-        with open(self.path_file, 'r') as f:
-            data = json.load(f)
+        # The binary file is memory-mapped as it is, it has no header and it is never parsed
+        if self.path_file.endswith(_BIN_SUFFIX):
+            return self._map_binary()
+
+        with open(self.path_file, 'rb') as f:
+            # Loads the cached waypoints of this version of the JSON file, identified by its size and
+            # modification time. The stamp is taken from the opened file, so it matches the parsed content.
+            stat = os.fstat(f.fileno())
+            cache_file = f"{self.path_file}.{stat.st_size}-{stat.st_mtime_ns}.npy"
+            waypoints = self._load_cache(cache_file)
+            if waypoints is not None:
+                return waypoints
+
+            # Reads the data from the JSON file, both the parsers accept the raw bytes
+            data = json_loads(f.read())
+
+        # Validates the waypoints against the schema, it also rejects the non numeric coordinates.
+        # The file is parsed only when the cache is outdated, so the validation is not repeated at every start.
+        if _VALIDATOR is not None:
+            error = next(_VALIDATOR.iter_errors(data), None)
+            if error is not None:
+                raise ValueError(f"TargetUpdater: Invalid waypoints file: {error.message}")
+
+        # Extracts the coordinates of each waypoint, {"x": val, "y": val, "z": val}.
+        # The entries are validated only if the extraction fails, to find the invalid one.
+        try:
+            rows = [(entry["x"], entry["y"], entry["z"]) for entry in data]
+        except (TypeError, KeyError):
+            self._validate_waypoints(data)
+            raise
+
+        # Stacks the waypoints in a single contiguous matrix, so each row is read as a view
+        waypoints = np.asarray(rows, dtype=np.float64).reshape(-1, 3)
+
+        # Checks all the coordinates in a single pass over the matrix,
+        # the standard JSON parser accepts the NaN and Infinity literals
+        if not np.isfinite(waypoints).all():
+            raise ValueError(f"TargetUpdater: Invalid waypoints file: the coordinates must be finite numbers")
+
+        self._save_cache(cache_file, waypoints)
+
+        return waypoints
 
-        waypoints = []
+    def _resample(self) -> np.ndarray:
+        """Resamples the keyframes of the trajectory at the update frequency.
+
+        The waypoints are placed every keyframe_dt seconds and the trajectory is interpolated at the
+        instants of the updates. When the path is looped, the last waypoint is joined to the first one
+        and the number of updates per loop is rounded, so the samples repeat without a discontinuity.
+
+        Returns:
+            A (M, 3) contiguous numpy array containing the target position of each update.
+        """
+        n = self.waypoints.shape[0]
+
+        # Edge case
+        # Without a keyframe interval, each update moves the target to the next waypoint
+        if self.keyframe_dt is None or n == 1:
+            return self.waypoints
+
+        if self.loop_path:
+            # Joins the last waypoint to the first one, and spreads the updates evenly over the loop
+            keyframes = np.vstack((self.waypoints, self.waypoints[:1]))
+            duration = n * self.keyframe_dt
+            n_samples = max(1, round(duration * self.freq))
+            t = np.arange(n_samples) * (duration / n_samples)
+        else:
+            # Samples the trajectory up to the last waypoint
+            keyframes = self.waypoints
+            duration = (n - 1) * self.keyframe_dt
+            t = np.arange(int(duration * self.freq + 1e-9) + 1) / self.freq
+
+        times = np.arange(keyframes.shape[0]) * self.keyframe_dt
+
+        if self.interp == "linear":
+            samples = np.column_stack([np.interp(t, times, keyframes[:, k]) for k in range(3)])
+        else:
+            # SciPy is only needed by the cubic interpolation
+            from scipy.interpolate import CubicSpline
+
+            spline = CubicSpline(times, keyframes, axis=0, bc_type="periodic" if self.loop_path else "not-a-knot")
+            samples = spline(t)
+
+        return np.ascontiguousarray(samples, dtype=np.float64)
+
+    @staticmethod
+    def _validate_waypoints(data) -> None:
+        """Validates the format of the waypoints read from the JSON file.
+
+        Args:
+            data: The parsed content of the JSON file.
+
+        Raises:
+            ValueError: If a waypoint doesn't contain X, Y, Z coordinates.
+            ValueError: If the waypoint format is different from the specified standard.
+        """
+        keys = {"x", "y", "z"}
 
-        # Loops to extract each single waypoint
         for entry in data:
-            if isinstance(entry, dict):
-                # Format: {"x": val, "y": val, "z": val}
-                if "x" in entry and "y" in entry and "z" in entry:
-                    x, y, z = entry["x"], entry["y"], entry["z"]
-                    waypoints.append(np.array([x, y, z]))
-                else:
-                    raise ValueError(f"TargetUpdater: Invalid waypoint object. Must contain x, y, z keys: {entry}")
-            else:
+            if not isinstance(entry, dict):
                 raise ValueError(f"TargetUpdater: Invalid waypoint format: {entry}")
+            if not entry.keys() >= keys:
+                raise ValueError(f"TargetUpdater: Invalid waypoint object. Must contain x, y, z keys: {entry}")
+
+    def _map_binary(self) -> np.ndarray:
+        """Memory-maps the waypoints from the .f64bin file.
+
+        The pages of the file are loaded on demand, so the cost does not depend on the trajectory length.
+
+        Returns:
+            A (N, 3) read-only numpy array containing the waypoints of the file.
+
+        Raises:
+            ValueError: If the size of the file is not a multiple of a waypoint size.
+            ValueError: If a coordinate of the file is not a finite number.
+        """
+        size = os.path.getsize(self.path_file)
+
+        # Edge case
+        if size % (3 * _BIN_DTYPE.itemsize) != 0:
+            raise ValueError(f"TargetUpdater: Invalid waypoints file size: {size} bytes is not a multiple of 3 float64")
+
+        # Edge case
+        # An empty file cannot be mapped, it is rejected by the empty trajectory check
+        if size == 0:
+            return np.empty((0, 3), dtype=np.float64)
+
+        waypoints = np.memmap(self.path_file, dtype=_BIN_DTYPE, mode="r").reshape(-1, 3)
+
+        # Checks all the coordinates in a single pass over the mapped file, as for the JSON file
+        if not np.isfinite(waypoints).all():
+            raise ValueError(f"TargetUpdater: Invalid waypoints file: the coordinates must be finite numbers")
+
+        return waypoints
+
+    def _load_cache(self, cache_file: str):
+        """Loads the waypoints from the cache file.
+
+        The cache is memory-mapped, so the waypoints are not copied in memory.
+
+        Args:
+            cache_file: The path of the .npy cache file.
+
+        Returns:
+            A (N, 3) read-only numpy array containing the cached waypoints, or None if the cache
+            is missing or invalid.
+        """
+        try:
+            waypoints = np.load(cache_file, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+
+        # Edge case
+        if waypoints.dtype != np.float64 or waypoints.ndim != 2 or waypoints.shape[1] != 3:
+            return None
 
         return waypoints
 
+    def _save_cache(self, cache_file: str, waypoints: np.ndarray) -> None:
+        """Saves the waypoints in the cache file.
+
+        The cache is written in a temporary file and then renamed, so a concurrent start never
+        loads a partial file. The caches of the previous versions of the JSON file are removed.
+        The cache is optional, so a write error is ignored.
+
+        Args:
+            cache_file: The path of the .npy cache file.
+            waypoints: A (N, 3) numpy array containing the waypoints.
+        """
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+
+        try:
+            with open(tmp_file, 'wb') as f:
+                np.save(f, waypoints)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            if self.verbose:
+                print(f"TargetUpdater: Cannot write the waypoints cache {cache_file}")
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            return
+
+        # The stamps of the previous versions never match again, so their caches are stale
+        for old_file in glob.glob(glob.escape(self.path_file) + ".*-*.npy"):
+            if old_file != cache_file:
+                try:
+                    os.remove(old_file)
+                except OSError:
+                    pass
+
     def _run(self) -> None:
         """Thread body function that updates the target position.
 
-        The target position is updated following the trajectory specified by the waypoints.
+        The target position is updated following the trajectory specified by the waypoints,
+        one sample of the trajectory at each update.
         When loop_path is set to True, the function will continue to execute until the main thread is running.
         When loop_path is set to False, the function will terminate after completing the trajectory once.
         """
-        index = 0
+        # The verbose flag never changes, so it is bound to a local with the formatted waypoints
+        verbose = self.verbose
+        waypoint_strs = self._waypoint_strs
 
-        # Computes the time interval
-        interval = 1.0 / self.freq
+        # Binds the samples of the trajectory and the update method of the domain object to locals
+        samples = self._samples
+        set_position = self.data_ref.set_position
 
-        print("TargetUpdater: Thread started, following trajectory from JSON file")
+        # Indices of the samples, the loop path repeats them indefinitely
+        indices = itertools.cycle(range(samples.shape[0])) if self.loop_path else range(samples.shape[0])
 
-        # Update loop
-        while True:
-            curr_pos = self.waypoints[index]
-            self.data_ref.set_position(new_pos=curr_pos)
+        # Computes the time interval in integer nanoseconds, so the deadlines do not accumulate rounding errors
+        interval_ns = round(1e9 / self.freq)
+        spin_ns = self.spin_ns
+        monotonic_ns = time.monotonic_ns
+        sleep = time.sleep
 
-            print(f"TargetUpdater: Updated the position to: {curr_pos[0]:.3f};{curr_pos[1]:.3f};{curr_pos[2]:.3f}")
+        print("TargetUpdater: Thread started, following trajectory from JSON file")
 
-            # Sleeps to meet the required frequency
-            time.sleep(interval)
+        # Reduces the oversleep of the timed waits of this thread
+        self._pin_cpu()
+        self._raise_timer_precision()
 
-            index += 1
+        # The deadlines are computed from the start time on the monotonic clock.
+        # The time spent by the update and the oversleep of the previous tick are absorbed by the next sleep,
+        # so the update rate does not drift from the requested frequency.
+        next_ns = time.monotonic_ns()
 
-            # Loop path logic
-            if index >= len(self.waypoints):
-                if self.loop_path:
-                    # Restarts the path from the beginning
-                    index = 0
-                else:
-                    break
+        # Update loop
+        try:
+            for index in indices:
+                curr_pos = samples[index]
+                set_position(new_pos=curr_pos)
+
+                if verbose:
+                    print(f"TargetUpdater: Updated the position to: {waypoint_strs[index]}")
+
+                # Waits until the next deadline to meet the required frequency.
+                # The thread sleeps until the last part of the interval, then it spins on the clock,
+                # so the deadline is not missed by the oversleep of the timed wait.
+                next_ns += interval_ns
+                remaining_ns = next_ns - monotonic_ns()
+                if remaining_ns > spin_ns:
+                    sleep((remaining_ns - spin_ns) * 1e-9)
+                while monotonic_ns() < next_ns:
+                    pass
+        finally:
+            self._restore_timer_precision()
 
         print("TargetUpdater: Thread stopped")
 
+    def _pin_cpu(self) -> None:
+        """Pins the calling thread to the requested CPU.
+
+        The thread is not migrated between CPUs, so its wake-up latency does not depend on the
+        migration and its data stays in the caches of the same CPU. The affinity is optional,
+        if it is not supported or the CPU is not available the thread can run on any CPU.
+        """
+        # Edge case
+        if self.cpu_id is None:
+            return
+
+        try:
+            # On Linux the PID 0 refers to the calling thread
+            os.sched_setaffinity(0, {self.cpu_id})
+        except (OSError, AttributeError, ValueError):
+            if self.verbose:
+                print(f"TargetUpdater: Cannot pin the thread to CPU {self.cpu_id}")
+
+    def _raise_timer_precision(self) -> None:
+        """Raises the precision of the timed waits of the calling thread.
+
+        On Linux the timer slack of the thread is reduced to 1ns and, if requested, the thread is moved
+        to the SCHED_FIFO real-time class, so its wake-ups are not delayed by the normal threads.
+        On Windows the system timer resolution is raised to 1ms.
+        Each setting is optional, if it is not permitted the thread keeps the default scheduling.
+        """
+        if sys.platform.startswith("linux"):
+            # Sets the timer slack, the default one adds 50us to each sleep
+            try:
+                libc = ctypes.CDLL(None, use_errno=True)
+                libc.prctl(_PR_SET_TIMERSLACK, ctypes.c_ulong(1), 0, 0, 0)
+            except (OSError, AttributeError):
+                pass
+
+            # Sets the real-time scheduling class, it requires the CAP_SYS_NICE capability
+            if self.realtime:
+                try:
+                    os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(_FIFO_PRIORITY))
+                except (OSError, AttributeError):
+                    if self.verbose:
+                        print("TargetUpdater: Real-time scheduling not permitted, using the default scheduling")
+        elif sys.platform == "win32":
+            try:
+                ctypes.windll.winmm.timeBeginPeriod(1)
+            except (OSError, AttributeError):
+                pass
+
+    def _restore_timer_precision(self) -> None:
+        """Restores the system timer resolution raised by _raise_timer_precision.
+
+        Only the Windows timer resolution is a system-wide setting, the Linux settings belong
+        to the thread and are released when it terminates.
+        """
+        if sys.platform == "win32":
+            try:
+                ctypes.windll.winmm.timeEndPeriod(1)
+            except (OSError, AttributeError):
+                pass
+
     def start(self) -> None:
         """Starts the thread for updating the target position.
         """
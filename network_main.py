@@ -1,15 +1,11 @@
 if __name__ == '__main__':
     # Usage Example
     # python3 network_main.py
+    # Equivalent to: python3 -m multilat_sensor_net network [args]
 
-    from multilat_sensor_net.network import NetworkController
-    import argparse
+    import runpy
+    import sys
 
-    # Parse command-line arguments
-    parser = argparse.ArgumentParser(description='Start the Network.')
-    parser.add_argument('--verbose', action='store_true', help='Enable verbose mode')
-    args = parser.parse_args()
-
-    # Create NetworkController object with the parsed arguments
-    obj = NetworkController(socket_addr="localhost:50052", verbose=args.verbose)
-    obj.start()
+    # Forwards the arguments to the package entry point with the role of this script
+    sys.argv.insert(1, 'network')
+    runpy.run_module('multilat_sensor_net', run_name='__main__', alter_sys=True)
@@ -1,27 +1,11 @@
 if __name__ == '__main__':
-    # Usage Example:
+    # Usage Example
     # python3 target_main.py
+    # Equivalent to: python3 -m multilat_sensor_net target [args]
 
-    from multilat_sensor_net.target import TargetController
-    import argparse
+    import runpy
+    import sys
 
-    # Parse command-line arguments
-    parser = argparse.ArgumentParser(description='Start the Target.')
-    parser.add_argument(
-        '--verbose',
-        action='store_true',
-        help='Enable verbose mode'
-    )
-    args = parser.parse_args()
-
-    # Create TargetController object with the parsed arguments
-    obj = TargetController(
-        socket_addr="localhost:50051",
-        path_file="data/circular_path.json",
-        freq=3,
-        loop_path=True,
-        verbose=args.verbose  # Set verbosity based on the argument
-    )
-
-    # Start the TargetController
-    obj.start()
+    # Forwards the arguments to the package entry point with the role of this script
+    sys.argv.insert(1, 'target')
+    runpy.run_module('multilat_sensor_net', run_name='__main__', alter_sys=True)
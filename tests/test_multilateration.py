@@ -0,0 +1,49 @@
+"""Regression tests of the Multilateration class.
+
+Usage Example:
+    python3 -m unittest discover -s tests
+"""
+
+from multilat_sensor_net.estimator import Multilateration
+import numpy as np
+import unittest
+
+
+class TestCoplanarSensors(unittest.TestCase):
+    """Tests the estimate when all the sensors lie on the same plane."""
+
+    target = np.array([2., 1., 1.2])
+
+    def estimate(self, sensor_xyz: np.ndarray, rounds: int = 3) -> list:
+        """Estimates the target position for some rounds with exact distances."""
+        estimator = Multilateration(verbose=False)
+        estimator.set_sensor_matrix(sensor_ids=list(range(len(sensor_xyz))), sensor_xyz=sensor_xyz)
+        distances = np.linalg.norm(sensor_xyz - self.target, axis=1)
+
+        return [estimator.estimate_position(distances=distances.copy()).copy() for _ in range(rounds)]
+
+    def test_three_floor_sensors(self):
+        sensor_xyz = np.array([[0., 0., 0.], [4., 0., 0.], [0., 3., 0.]])
+        for pos in self.estimate(sensor_xyz):
+            np.testing.assert_allclose(pos, self.target, atol=1e-6)
+
+    def test_four_floor_sensors(self):
+        sensor_xyz = np.array([[0., 0., 0.], [4., 0., 0.], [0., 3., 0.], [4., 3., 0.]])
+        for pos in self.estimate(sensor_xyz):
+            np.testing.assert_allclose(pos, self.target, atol=1e-6)
+
+    def test_keeps_the_side_of_the_previous_estimate(self):
+        # The plane of the sensors does not pass through the origin, the target is
+        # 0.2 above it and the previous estimate is above it too
+        sensor_xyz = np.array([[0., 0., 1.], [4., 0., 1.], [0., 3., 1.], [4., 3., 1.]])
+        estimator = Multilateration(verbose=False)
+        estimator.set_sensor_matrix(sensor_ids=list(range(len(sensor_xyz))), sensor_xyz=sensor_xyz)
+        estimator._initial_guess = np.array([2., 1., 2.])
+
+        distances = np.linalg.norm(sensor_xyz - self.target, axis=1)
+        for _ in range(3):
+            np.testing.assert_allclose(estimator.estimate_position(distances=distances.copy()), self.target, atol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()